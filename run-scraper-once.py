@@ -73,6 +73,9 @@ async def main():
 
     # Show stats
     stats = await pipeline.get_supabase_stats()
+    await pipeline.close()
+    await supabase_storage.close()
+    await image_handler.close()
 
     print("\n" + "=" * 60)
     print("📊 Resultados:")
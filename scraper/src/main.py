@@ -11,7 +11,7 @@ from loguru import logger
 
 from models.article import Article, ScrapingResult
 from scrapers.news_scraper import NewsScraper
-from storage.database import Database
+from storage.async_database import AsyncDatabase
 from storage.cache import Cache
 from utils.logger import setup_logger
 from utils.image_handler import ImageHandler
@@ -56,7 +56,7 @@ class ScraperOrchestrator:
         )
 
         # Initialize components
-        self.db = Database(settings.database_url)
+        self.db = AsyncDatabase(settings.database_url)
         self.cache = Cache(settings.redis_url)
         self.image_handler = ImageHandler(
             output_dir="data/images",
@@ -121,21 +121,40 @@ class ScraperOrchestrator:
                 if all_articles:
                     logger.info(f"Saving {len(all_articles)} articles from {source_name}")
 
-                    for article in all_articles:
-                        try:
-                            # Check if already exists
-                            if not self.db.article_exists(str(article.source_url)):
-                                if self.db.save_article(article.to_dict()):
-                                    articles_saved += 1
+                    try:
+                        # One IN query instead of an article_exists lookup per article
+                        existing = await self.db.existing_source_urls(
+                            [str(article.source_url) for article in all_articles]
+                        )
+                        new_articles = {
+                            str(article.source_url): article
+                            for article in all_articles
+                            if str(article.source_url) not in existing
+                        }
+
+                        articles_saved = await self.db.save_articles(
+                            [article.to_dict() for article in new_articles.values()]
+                        )
 
-                                    # Cache article
-                                    cache_key = f"article:{article.id}"
-                                    self.cache.set(cache_key, article.to_dict(), ttl=7200)
+                        saved_urls = set(new_articles)
+                        if articles_saved < len(new_articles):
+                            # Some rows failed: cache only the ones actually stored
+                            saved_urls = await self.db.existing_source_urls(list(new_articles))
+                            errors.append(
+                                f"Error saving articles: {len(new_articles) - articles_saved} not saved"
+                            )
 
-                        except Exception as e:
-                            error_msg = f"Error saving article: {e}"
-                            logger.error(error_msg)
-                            errors.append(error_msg)
+                        for url in saved_urls:
+                            article = new_articles[url]
+
+                            # Cache article
+                            cache_key = f"article:{article.id}"
+                            self.cache.set(cache_key, article.to_dict(), ttl=7200)
+
+                    except Exception as e:
+                        error_msg = f"Error saving articles: {e}"
+                        logger.error(error_msg)
+                        errors.append(error_msg)
 
             duration = time.time() - start_time
 
@@ -203,7 +222,7 @@ class ScraperOrchestrator:
         logger.info("=" * 60)
 
         # Get database stats
-        db_stats = self.db.get_stats()
+        db_stats = await self.db.get_stats()
         logger.info(f"Database stats: {db_stats}")
 
         return results
@@ -245,6 +264,7 @@ async def main():
 
     # Create orchestrator
     orchestrator = ScraperOrchestrator(settings)
+    await orchestrator.db.create_tables()
 
     # Check if running once or continuously
     run_mode = os.getenv("RUN_MODE", "continuous")
@@ -256,6 +276,9 @@ async def main():
         logger.info("Running scraper continuously")
         await orchestrator.run_continuous()
 
+    await orchestrator.image_handler.close()
+    await orchestrator.db.close()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
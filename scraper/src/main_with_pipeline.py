@@ -81,7 +81,8 @@ async def main():
         supabase_url=settings.supabase_url,
         supabase_key=storage_key
     )
-    
+    await supabase_storage.prefetch_categories()
+
     image_handler = ImageHandler(
         output_dir="data/images",
         max_size=settings.max_image_size,
@@ -143,6 +144,10 @@ async def main():
                 logger.info("Waiting 60s before retry...")
                 await asyncio.sleep(60)
 
+    await pipeline.close()
+    await supabase_storage.close()
+    await image_handler.close()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -59,6 +59,18 @@ class ArticlePipeline:
         logger.info(f"  - LLM Rewriting: {'Enabled' if rewrite_enabled else 'Disabled'}")
         logger.info(f"  - Storage: Supabase only")
 
+    async def warmup(self):
+        """Open the Supabase and OpenRouter connections ahead of the first real request"""
+        warmups = [self.storage.warmup()]
+        if self.llm_rewriter:
+            warmups.append(self.llm_rewriter.warmup())
+        await asyncio.gather(*warmups)
+
+    async def close(self):
+        """Close the LLM rewriter's HTTP client"""
+        if self.llm_rewriter:
+            await self.llm_rewriter.close()
+
     async def process_source(
         self,
         scraper_class,
@@ -180,10 +192,20 @@ class ArticlePipeline:
         is_rewritten: bool = False
     ):
         """Save articles to Supabase with image upload"""
-        saved = 0
+        to_save = []
+
+        # Una sola consulta para todos los source_url ya guardados
+        existing = await self.storage.existing_source_urls(
+            [str(article.source_url) for article in articles]
+        )
 
         for article in articles:
             try:
+                # Verificar por source_url para evitar duplicados (el source_url no cambia aunque el título cambie)
+                if str(article.source_url) in existing:
+                    logger.debug(f"Article already exists (by source_url): {article.title[:50]}...")
+                    continue
+
                 article_dict = article.to_dict()
 
                 # Procesar imagen para Supabase Storage
@@ -229,22 +251,15 @@ class ArticlePipeline:
                     logger.warning(f"⚠️  Article without image, using placeholder: {article.title[:50]}...")
                     article_dict["image_url"] = 'data:image/svg+xml,%3Csvg xmlns="http://www.w3.org/2000/svg" width="800" height="400"%3E%3Crect width="800" height="400" fill="%23e5e7eb"/%3E%3Ctext x="50%25" y="50%25" dominant-baseline="middle" text-anchor="middle" font-family="sans-serif" font-size="24" fill="%239ca3af"%3ESin imagen%3C/text%3E%3C/svg%3E'
 
-                # Verificar si existe por source_url antes de guardar (NO por slug, porque el LLM genera títulos diferentes)
-                source_url = article_dict.get("source_url", "")
-
-                # Verificar por source_url para evitar duplicados (el source_url no cambia aunque el título cambie)
-                if source_url and await self.storage.article_exists_by_source_url(source_url):
-                    logger.debug(f"Article already exists (by source_url): {article_dict['title'][:50]}...")
-                    continue
-                
                 # Guardar si no existe
-                if await self.storage.save_article(article_dict):
-                    saved += 1
-                    logger.info(f"✅ New article saved: {article_dict['title'][:50]}...")
+                to_save.append(article_dict)
 
             except Exception as e:
                 logger.error(f"Error saving article to Supabase: {e}")
 
+        # Un solo upsert masivo para todos los artículos nuevos
+        saved = await self.storage.save_articles(to_save)
+
         logger.info(f"Saved {saved}/{len(articles)} articles to Supabase")
 
     async def run_full_pipeline(self) -> Dict:
@@ -281,8 +296,11 @@ class ArticlePipeline:
             for scraper_class, source_name, base_url in sources
         ]
 
-        # Wait for all sources to complete
-        source_results = await asyncio.gather(*source_tasks, return_exceptions=True)
+        # Wait for all sources to complete (warming the API connections meanwhile)
+        source_results, _ = await asyncio.gather(
+            asyncio.gather(*source_tasks, return_exceptions=True),
+            self.warmup()
+        )
 
         # Process results
         for result in source_results:
@@ -135,6 +135,16 @@ class NewsScrapingPipeline:
 
         logger.info("✅ Pipeline initialized")
 
+    async def warmup(self):
+        """Open the OpenRouter connection ahead of the first rewrite"""
+        if self.llm_rewriter:
+            await self.llm_rewriter.warmup()
+
+    async def close(self):
+        """Close the LLM rewriter's HTTP client"""
+        if self.llm_rewriter:
+            await self.llm_rewriter.close()
+
     async def cleanup_old_news(self, days: int = 3):
         """Delete news older than N days including their images"""
         logger.info(f"🗑️  Starting cleanup: Deleting news older than {days} days...")
@@ -460,9 +470,12 @@ class NewsScrapingPipeline:
 
         start_time = datetime.now()
 
-        # Step 1: Cleanup old news
+        # Step 1: Cleanup old news (warming the LLM connection meanwhile)
         logger.info("\n📋 STEP 1: Cleanup old news")
-        deleted = await self.cleanup_old_news(days=cleanup_days)
+        deleted, _ = await asyncio.gather(
+            self.cleanup_old_news(days=cleanup_days),
+            self.warmup()
+        )
 
         # Step 2: Scrape fresh news
         logger.info("\n📋 STEP 2: Scrape fresh news")
@@ -532,6 +545,9 @@ async def main():
         traceback.print_exc()
         return 1
 
+    finally:
+        await pipeline.close()
+
 
 if __name__ == '__main__':
     exit_code = asyncio.run(main())
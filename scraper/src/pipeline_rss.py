@@ -52,6 +52,18 @@ class RSSArticlePipeline:
         logger.info(f"  - LLM Rewriting: {'Enabled' if rewrite_enabled else 'Disabled'}")
         logger.info(f"  - Storage: Supabase")
 
+    async def warmup(self):
+        """Open the Supabase and OpenRouter connections ahead of the first real request"""
+        warmups = [self.storage.warmup()]
+        if self.rewrite_enabled and self.llm_rewriter:
+            warmups.append(self.llm_rewriter.warmup())
+        await asyncio.gather(*warmups)
+
+    async def close(self):
+        """Close the LLM rewriter's HTTP client"""
+        if self.llm_rewriter:
+            await self.llm_rewriter.close()
+
     async def run_full_pipeline(self) -> Dict:
         """Run complete RSS pipeline"""
         start_time = datetime.now()
@@ -69,10 +81,13 @@ class RSSArticlePipeline:
         }
 
         try:
-            # Step 1: Scrape RSS feeds
+            # Step 1: Scrape RSS feeds (warming the API connections meanwhile)
             logger.info("Step 1/3: Scraping RSS feeds...")
-            raw_articles = await self.rss_scraper.scrape_all_sources(
-                max_articles_per_source=self.max_articles_per_category
+            raw_articles, _ = await asyncio.gather(
+                self.rss_scraper.scrape_all_sources(
+                    max_articles_per_source=self.max_articles_per_category
+                ),
+                self.warmup()
             )
             overall_stats["total_scraped"] = len(raw_articles)
             logger.success(f"✅ Scraped {len(raw_articles)} articles from RSS feeds")
@@ -166,7 +181,12 @@ class RSSArticlePipeline:
 
     async def _save_to_supabase(self, articles: List[Article]) -> int:
         """Save articles to Supabase"""
-        saved = 0
+        to_save = []
+
+        # One query for every source_url already stored
+        existing = await self.storage.existing_source_urls(
+            [str(article.source_url) for article in articles]
+        )
 
         for article in articles:
             try:
@@ -178,18 +198,18 @@ class RSSArticlePipeline:
 
                 # Check for duplicates by source_url
                 source_url = article_dict.get("source_url", "")
-                if source_url and await self.storage.article_exists_by_source_url(source_url):
+                if source_url in existing:
                     logger.debug(f"Article exists: {article_dict['title'][:50]}...")
                     continue
 
-                # Save article
-                if await self.storage.save_article(article_dict):
-                    saved += 1
-                    logger.info(f"✅ Saved: {article_dict['title'][:50]}...")
+                to_save.append(article_dict)
 
             except Exception as e:
                 logger.error(f"Error saving article: {e}")
 
+        # Save all new articles in one bulk upsert
+        saved = await self.storage.save_articles(to_save)
+
         logger.info(f"Saved {saved}/{len(articles)} articles to Supabase")
         return saved
 
@@ -30,7 +30,8 @@ class BaseScraper(ABC):
         headless: bool = False,  # Cambiar a False para debugging en macOS
         timeout: int = None,  # Will be set from env or default
         enable_stealth: bool = True,  # Enable stealth mode by default
-        requests_per_minute: int = None  # Rate limiting
+        requests_per_minute: int = None,  # Rate limiting
+        stealth_level: str = None  # "slim" (default) or "full" stealth script
     ):
         self.source_name = source_name
         self.base_url = base_url
@@ -47,6 +48,10 @@ class BaseScraper(ABC):
         self.enable_stealth = enable_stealth
         self.user_agent = StealthConfig.get_random_user_agent()
         self.viewport_size = StealthConfig.get_viewport_size()
+        # Nivel del script anti-detección (configurable por scraper o via env)
+        if stealth_level is None:
+            stealth_level = os.getenv("STEALTH_LEVEL", "slim")
+        self.stealth_level = stealth_level
 
         # Rate limiting (configurable via env or default)
         if requests_per_minute is None:
@@ -138,7 +143,7 @@ class BaseScraper(ABC):
             await page.set_extra_http_headers(headers)
 
             # Inject advanced anti-detection script
-            advanced_script = get_advanced_stealth_script()
+            advanced_script = get_advanced_stealth_script(self.stealth_level)
             await page.add_init_script(advanced_script)
             
             # Additional page-level overrides
@@ -18,6 +18,11 @@ except ImportError:
         sys.path.insert(0, str(Path(__file__).parent.parent))
         from models.article import Article
 
+try:
+    from .payload import encode_json_body
+except ImportError:
+    from services.payload import encode_json_body
+
 
 class LLMRewriter:
     """Rewrite articles using LLM via OpenRouter"""
@@ -33,6 +38,20 @@ class LLMRewriter:
         self.base_url = base_url
         self.timeout = 120  # 2 minutes timeout for LLM
 
+        # Shared client so every request reuses the pooled TLS connection
+        self.client = httpx.AsyncClient(timeout=self.timeout)
+
+    async def warmup(self):
+        """Open the connection to OpenRouter ahead of the first rewrite"""
+        try:
+            await self.client.get(f"{self.base_url}/models", timeout=5)
+        except Exception as e:
+            logger.debug(f"OpenRouter warmup failed: {e}")
+
+    async def close(self):
+        """Close HTTP client"""
+        await self.client.aclose()
+
     async def rewrite_article(
         self,
         article: Article,
@@ -137,38 +156,39 @@ Responde ÚNICAMENTE con el JSON, sin texto adicional antes ni después."""
     async def _call_openrouter(self, prompt: str) -> Optional[Dict]:
         """Call OpenRouter API"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                        "HTTP-Referer": "https://periodico-argentino.vercel.app",
-                        "X-Title": "Periodico Argentino Scraper"
-                    },
-                    json={
-                        "model": self.model,
-                        "messages": [
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ],
-                        "temperature": 0.7,
-                        "max_tokens": 3500
+            body, body_headers = encode_json_body({
+                "model": self.model,
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": prompt
                     }
-                )
+                ],
+                "temperature": 0.7,
+                "max_tokens": 3500
+            })
+
+            response = await self.client.post(
+                f"{self.base_url}/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "HTTP-Referer": "https://periodico-argentino.vercel.app",
+                    "X-Title": "Periodico Argentino Scraper",
+                    **body_headers
+                },
+                content=body
+            )
 
-                response.raise_for_status()
-                data = response.json()
+            response.raise_for_status()
+            data = response.json()
 
-                # Extract content
-                if "choices" in data and len(data["choices"]) > 0:
-                    content = data["choices"][0]["message"]["content"]
-                    return {"content": content}
+            # Extract content
+            if "choices" in data and len(data["choices"]) > 0:
+                content = data["choices"][0]["message"]["content"]
+                return {"content": content}
 
-                logger.error("Unexpected API response format")
-                return None
+            logger.error("Unexpected API response format")
+            return None
 
         except httpx.HTTPError as e:
             logger.error(f"HTTP error calling OpenRouter: {e}")
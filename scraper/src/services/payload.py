@@ -0,0 +1,42 @@
+"""
+JSON request body encoding helpers
+"""
+import gzip
+import json
+from typing import Any, Dict, Tuple
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Bodies below this size are sent as-is; gzip framing would outweigh the savings
+GZIP_MIN_BYTES = 1024
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes (orjson when available)"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def encode_json_body(obj: Any) -> Tuple[bytes, Dict[str, str]]:
+    """
+    Encode a JSON request body, gzip-compressing it when large enough
+
+    Args:
+        obj: JSON-serializable payload
+
+    Returns:
+        Tuple of (body bytes, extra headers to send with it)
+    """
+    body = dumps_json(obj)
+    headers = {"Content-Type": "application/json"}
+
+    if len(body) >= GZIP_MIN_BYTES:
+        body = gzip.compress(body, compresslevel=1)
+        headers["Content-Encoding"] = "gzip"
+
+    return body, headers
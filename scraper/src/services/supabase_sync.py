@@ -7,6 +7,7 @@ from datetime import datetime
 import httpx
 from loguru import logger
 from ..models.article import Article
+from .payload import encode_json_body
 
 
 class SupabaseSync:
@@ -29,6 +30,24 @@ class SupabaseSync:
             "Content-Type": "application/json"
         }
 
+        # Shared client so every request reuses the pooled TLS connection
+        self.client = httpx.AsyncClient(timeout=self.timeout)
+
+    async def warmup(self):
+        """Open the connection to Supabase ahead of the first real request"""
+        try:
+            await self.client.get(
+                f"{self.supabase_url}/rest/v1/",
+                headers=self.headers,
+                timeout=5
+            )
+        except Exception as e:
+            logger.debug(f"Supabase warmup failed: {e}")
+
+    async def close(self):
+        """Close HTTP client"""
+        await self.client.aclose()
+
     async def sync_article(self, article: Article) -> bool:
         """
         Sync single article to Supabase
@@ -114,27 +133,26 @@ class SupabaseSync:
                 image_data = await f.read()
 
             # Upload to Supabase Storage
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                upload_url = f"{self.supabase_url}/storage/v1/object/{self.storage_bucket}/{remote_path}"
-
-                response = await client.post(
-                    upload_url,
-                    headers={
-                        "apikey": self.supabase_key,
-                        "Authorization": f"Bearer {self.supabase_key}",
-                        "Content-Type": "image/jpeg"
-                    },
-                    content=image_data
-                )
-
-                if response.status_code in [200, 201]:
-                    # Return public URL
-                    public_url = f"{self.supabase_url}/storage/v1/object/public/{self.storage_bucket}/{remote_path}"
-                    logger.debug(f"Uploaded image: {remote_path}")
-                    return public_url
-                else:
-                    logger.error(f"Failed to upload image: {response.status_code} - {response.text}")
-                    return None
+            upload_url = f"{self.supabase_url}/storage/v1/object/{self.storage_bucket}/{remote_path}"
+
+            response = await self.client.post(
+                upload_url,
+                headers={
+                    "apikey": self.supabase_key,
+                    "Authorization": f"Bearer {self.supabase_key}",
+                    "Content-Type": "image/jpeg"
+                },
+                content=image_data
+            )
+
+            if response.status_code in [200, 201]:
+                # Return public URL
+                public_url = f"{self.supabase_url}/storage/v1/object/public/{self.storage_bucket}/{remote_path}"
+                logger.debug(f"Uploaded image: {remote_path}")
+                return public_url
+            else:
+                logger.error(f"Failed to upload image: {response.status_code} - {response.text}")
+                return None
 
         except Exception as e:
             logger.error(f"Error uploading image to Supabase: {e}")
@@ -143,22 +161,24 @@ class SupabaseSync:
     async def _upsert_article(self, article_data: Dict) -> bool:
         """Upsert article to Supabase database"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Use upsert (insert or update if exists)
-                response = await client.post(
-                    f"{self.supabase_url}/rest/v1/articles",
-                    headers={
-                        **self.headers,
-                        "Prefer": "resolution=merge-duplicates"
-                    },
-                    json=article_data
-                )
-
-                if response.status_code in [200, 201]:
-                    return True
-                else:
-                    logger.error(f"Supabase upsert failed: {response.status_code} - {response.text}")
-                    return False
+            body, body_headers = encode_json_body(article_data)
+
+            # Use upsert (insert or update if exists)
+            response = await self.client.post(
+                f"{self.supabase_url}/rest/v1/articles",
+                headers={
+                    **self.headers,
+                    **body_headers,
+                    "Prefer": "resolution=merge-duplicates"
+                },
+                content=body
+            )
+
+            if response.status_code in [200, 201]:
+                return True
+            else:
+                logger.error(f"Supabase upsert failed: {response.status_code} - {response.text}")
+                return False
 
         except Exception as e:
             logger.error(f"Error upserting to Supabase: {e}")
@@ -205,18 +225,17 @@ class SupabaseSync:
     async def delete_article(self, article_id: str) -> bool:
         """Delete article from Supabase"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.delete(
-                    f"{self.supabase_url}/rest/v1/articles?id=eq.{article_id}",
-                    headers=self.headers
-                )
+            response = await self.client.delete(
+                f"{self.supabase_url}/rest/v1/articles?id=eq.{article_id}",
+                headers=self.headers
+            )
 
-                if response.status_code == 204:
-                    logger.info(f"Deleted article from Supabase: {article_id}")
-                    return True
-                else:
-                    logger.error(f"Failed to delete: {response.status_code}")
-                    return False
+            if response.status_code == 204:
+                logger.info(f"Deleted article from Supabase: {article_id}")
+                return True
+            else:
+                logger.error(f"Failed to delete: {response.status_code}")
+                return False
 
         except Exception as e:
             logger.error(f"Error deleting from Supabase: {e}")
@@ -225,17 +244,16 @@ class SupabaseSync:
     async def get_existing_articles(self, limit: int = 1000) -> List[Dict]:
         """Get existing articles from Supabase"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.supabase_url}/rest/v1/articles?select=id,slug,source_url&limit={limit}",
-                    headers=self.headers
-                )
+            response = await self.client.get(
+                f"{self.supabase_url}/rest/v1/articles?select=id,slug,source_url&limit={limit}",
+                headers=self.headers
+            )
 
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    logger.error(f"Failed to fetch articles: {response.status_code}")
-                    return []
+            if response.status_code == 200:
+                return response.json()
+            else:
+                logger.error(f"Failed to fetch articles: {response.status_code}")
+                return []
 
         except Exception as e:
             logger.error(f"Error fetching from Supabase: {e}")
@@ -244,17 +262,25 @@ class SupabaseSync:
     async def article_exists(self, source_url: str) -> bool:
         """Check if article exists in Supabase"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.supabase_url}/rest/v1/articles?source_url=eq.{source_url}&select=id",
-                    headers=self.headers
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return len(data) > 0
-                else:
-                    return False
+            # HEAD + count=exact: PostgREST reports the match count in
+            # Content-Range, so no JSON body is transferred. Passing the
+            # filter via params URL-encodes '?', '&' and '#' in source_url.
+            response = await self.client.head(
+                f"{self.supabase_url}/rest/v1/articles",
+                params={
+                    "source_url": f"eq.{source_url}",
+                    "select": "id",
+                    "limit": 1
+                },
+                headers={**self.headers, "Prefer": "count=exact"}
+            )
+
+            if response.status_code in [200, 206]:
+                content_range = response.headers.get("Content-Range", "0/0")
+                total = content_range.split("/")[-1]
+                return total.isdigit() and int(total) > 0
+            else:
+                return False
 
         except Exception as e:
             logger.error(f"Error checking article existence: {e}")
@@ -263,40 +289,39 @@ class SupabaseSync:
     async def get_stats(self) -> Dict:
         """Get statistics from Supabase"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Total articles
-                response = await client.get(
-                    f"{self.supabase_url}/rest/v1/articles?select=count",
+            # Total articles
+            response = await self.client.get(
+                f"{self.supabase_url}/rest/v1/articles?select=count",
+                headers={**self.headers, "Prefer": "count=exact"}
+            )
+
+            total = 0
+            if response.status_code == 200:
+                # Count is in the Content-Range header
+                content_range = response.headers.get("Content-Range", "")
+                if "/" in content_range:
+                    total = int(content_range.split("/")[1])
+
+            # By category
+            by_category = {}
+            categories = ["economia", "politica", "sociedad", "internacional", "judicial"]
+
+            for category in categories:
+                response = await self.client.get(
+                    f"{self.supabase_url}/rest/v1/articles?category_slug=eq.{category}&select=count",
                     headers={**self.headers, "Prefer": "count=exact"}
                 )
 
-                total = 0
                 if response.status_code == 200:
-                    # Count is in the Content-Range header
                     content_range = response.headers.get("Content-Range", "")
                     if "/" in content_range:
-                        total = int(content_range.split("/")[1])
-
-                # By category
-                by_category = {}
-                categories = ["economia", "politica", "sociedad", "internacional", "judicial"]
-
-                for category in categories:
-                    response = await client.get(
-                        f"{self.supabase_url}/rest/v1/articles?category_slug=eq.{category}&select=count",
-                        headers={**self.headers, "Prefer": "count=exact"}
-                    )
+                        count = int(content_range.split("/")[1])
+                        by_category[category] = count
 
-                    if response.status_code == 200:
-                        content_range = response.headers.get("Content-Range", "")
-                        if "/" in content_range:
-                            count = int(content_range.split("/")[1])
-                            by_category[category] = count
-
-                return {
-                    "total_articles": total,
-                    "by_category": by_category
-                }
+            return {
+                "total_articles": total,
+                "by_category": by_category
+            }
 
         except Exception as e:
             logger.error(f"Error getting Supabase stats: {e}")
@@ -308,18 +333,17 @@ class SupabaseSync:
             from datetime import timedelta
             cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.delete(
-                    f"{self.supabase_url}/rest/v1/articles?published_at=lt.{cutoff_date}",
-                    headers=self.headers
-                )
+            response = await self.client.delete(
+                f"{self.supabase_url}/rest/v1/articles?published_at=lt.{cutoff_date}",
+                headers=self.headers
+            )
 
-                if response.status_code == 204:
-                    logger.info(f"Cleaned up old articles (older than {days} days)")
-                    return 0  # Supabase doesn't return count on delete
-                else:
-                    logger.error(f"Failed to cleanup: {response.status_code}")
-                    return 0
+            if response.status_code == 204:
+                logger.info(f"Cleaned up old articles (older than {days} days)")
+                return 0  # Supabase doesn't return count on delete
+            else:
+                logger.error(f"Failed to cleanup: {response.status_code}")
+                return 0
 
         except Exception as e:
             logger.error(f"Error cleaning up Supabase: {e}")
@@ -2,6 +2,7 @@
 Storage package
 """
 from .database import Database
+from .async_database import AsyncDatabase
 from .cache import Cache
 
-__all__ = ['Database', 'Cache']
+__all__ = ['Database', 'AsyncDatabase', 'Cache']
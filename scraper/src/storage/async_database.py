@@ -0,0 +1,203 @@
+"""
+Async database storage for scraped articles (asyncpg / aiosqlite)
+"""
+from typing import List, Optional
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from loguru import logger
+
+from .database import (
+    Base,
+    ArticleDB,
+    UPSERT_BATCH_SIZE,
+    _ARTICLE_COLUMNS,
+    _ARTICLE_EXISTS_STMT,
+    _PG_READ_STMTS,
+    _READ_STMTS,
+    _batched,
+    _build_upsert,
+    _row_to_dict,
+)
+
+
+class AsyncDatabase:
+    """
+    Async database manager for articles
+
+    Same schema and statements as Database, but on an async engine so the
+    scraper's event loop can overlap DB round trips with HTTP I/O (used by
+    ScraperOrchestrator). The sync Database class remains the one used by
+    CLI/batch tools.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        pool_size: int = 20,
+        max_overflow: int = 10,
+        pool_recycle: int = 3600
+    ):
+        if database_url.startswith("postgresql://"):
+            database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+        elif database_url.startswith("sqlite://"):
+            database_url = database_url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+
+        engine_kwargs = {"echo": False}
+        if not database_url.startswith("sqlite"):
+            # SQLite (aiosqlite) picks its own pool; :memory: uses StaticPool,
+            # which rejects the queue-pool arguments
+            engine_kwargs.update(
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_pre_ping=True,  # Drop stale connections before use
+                pool_recycle=pool_recycle
+            )
+
+        self.engine = create_async_engine(database_url, **engine_kwargs)
+        self.SessionLocal = async_sessionmaker(self.engine, expire_on_commit=False)
+
+        if self.engine.dialect.name == 'postgresql':
+            self._read_stmts = _PG_READ_STMTS
+        else:
+            self._read_stmts = _READ_STMTS
+
+        logger.info(f"Async database initialized: {database_url.split('@')[-1]}")
+
+    async def create_tables(self):
+        """Create tables and indexes if they do not exist"""
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    async def close(self):
+        """Dispose of the connection pool"""
+        await self.engine.dispose()
+
+    def get_session(self) -> AsyncSession:
+        """Get async database session"""
+        return self.SessionLocal()
+
+    async def save_article(self, article_data: dict) -> bool:
+        """Save or update a single article"""
+        return await self.save_articles([article_data]) == 1
+
+    async def save_articles(self, articles_data: List[dict]) -> int:
+        """
+        Save multiple articles with one multi-row UPSERT per batch
+
+        Args:
+            articles_data: List of article dictionaries
+
+        Returns:
+            Number of articles saved
+        """
+        if not articles_data:
+            return 0
+
+        if _build_upsert(self.engine.dialect.name, ()) is None:
+            logger.error(f"Async upsert not supported for dialect: {self.engine.dialect.name}")
+            return 0
+
+        # Keyed by source_url: a statement may not touch the same row twice
+        unique_rows = {}
+        for article_data in articles_data:
+            source_url = article_data.get('source_url')
+            if not source_url:
+                logger.error(f"Skipping article without source_url: {str(article_data.get('title'))[:50]}...")
+                continue
+            unique_rows[source_url] = {
+                key: value for key, value in article_data.items() if key in _ARTICLE_COLUMNS
+            }
+
+        # Grouped by column set: a multi-row statement needs the same keys in every
+        # row, and padding missing ones with NULL would overwrite stored values
+        groups: dict = {}
+        for row in unique_rows.values():
+            groups.setdefault(frozenset(row), []).append(row)
+
+        saved = 0
+
+        async with self.get_session() as session:
+            for columns, group in groups.items():
+                stmt = _build_upsert(self.engine.dialect.name, columns)
+                for batch in _batched(group, UPSERT_BATCH_SIZE):
+                    saved += await self._save_batch(session, stmt, batch)
+
+        logger.info(f"Saved {saved}/{len(articles_data)} articles to database")
+        return saved
+
+    async def _save_batch(self, session: AsyncSession, stmt, batch: List[dict]) -> int:
+        """Write and commit one batch; if it fails, retry its rows one by one"""
+        try:
+            await session.execute(stmt, batch)
+            await session.commit()
+            return len(batch)
+
+        except Exception as e:
+            await session.rollback()
+            if len(batch) == 1:
+                logger.error(f"Error saving article: {e}")
+                return 0
+
+            # One bad row (e.g. a duplicate slug) fails the whole statement
+            logger.warning(f"Batch of {len(batch)} articles failed, saving one by one: {e}")
+            saved = 0
+            for row in batch:
+                saved += await self._save_batch(session, stmt, [row])
+            return saved
+
+    async def article_exists(self, source_url: str) -> bool:
+        """Check if article exists by URL"""
+        async with self.engine.connect() as conn:
+            result = await conn.execute(_ARTICLE_EXISTS_STMT, {'source_url': source_url})
+            return result.first() is not None
+
+    async def existing_source_urls(self, source_urls: List[str]) -> set:
+        """
+        Return which of `source_urls` are already stored
+
+        Args:
+            source_urls: Candidate URLs
+
+        Returns:
+            Set of stored URLs, found with one IN query per UPSERT_BATCH_SIZE URLs
+        """
+        found = set()
+        async with self.engine.connect() as conn:
+            for batch in _batched(set(source_urls), UPSERT_BATCH_SIZE):
+                found.update(await conn.scalars(
+                    select(ArticleDB.source_url)
+                    .where(ArticleDB.source_url.in_(batch))
+                ))
+        return found
+
+    async def get_recent_articles(self, limit: int = 50) -> List[dict]:
+        """Get most recent articles"""
+        async with self.engine.connect() as conn:
+            result = await conn.execute(self._read_stmts['recent'], {'limit': limit})
+            return [_row_to_dict(r) for r in result]
+
+    async def get_article(self, article_id: str) -> Optional[dict]:
+        """Get article by ID"""
+        async with self.engine.connect() as conn:
+            result = await conn.execute(self._read_stmts['by_id'], {'article_id': article_id})
+            row = result.first()
+            return _row_to_dict(row) if row else None
+
+    async def get_stats(self) -> dict:
+        """Get database statistics"""
+        async with self.engine.connect() as conn:
+            by_category = dict((await conn.execute(
+                select(ArticleDB.category_slug, func.count())
+                .group_by(ArticleDB.category_slug)
+            )).all())
+
+            by_source = dict((await conn.execute(
+                select(ArticleDB.source, func.count())
+                .group_by(ArticleDB.source)
+            )).all())
+
+        return {
+            'total_articles': sum(by_category.values()),
+            'by_category': by_category,
+            'by_source': by_source
+        }
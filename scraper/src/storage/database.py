@@ -1,15 +1,56 @@
 """
 Database storage for scraped articles
 """
+import os
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Optional
-from sqlalchemy import create_engine, Column, String, Text, Integer, Boolean, DateTime, JSON
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Optional
+from sqlalchemy import bindparam, create_engine, delete, event, func, insert, select, update, Column, String, Text, Integer, Boolean, DateTime, Index, JSON
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 from loguru import logger
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 Base = declarative_base()
 
+# Rows per multi-row UPSERT statement in save_articles
+UPSERT_BATCH_SIZE = 1000
+
+# Max source_url entries remembered by the article_exists LRU cache
+EXISTS_CACHE_SIZE = 50_000
+
+# Seconds and max entries for cached get_recent_articles/get_breaking_news/get_stats
+READ_CACHE_TTL = 60
+READ_CACHE_SIZE = 128
+
+# EXPLAIN prefix per dialect for slow-query logging. Plain EXPLAIN (no ANALYZE):
+# the plan is estimated without running the slow statement a second time
+_EXPLAIN_PREFIX = {
+    'postgresql': 'EXPLAIN ',
+    'mysql': 'EXPLAIN ',
+    'sqlite': 'EXPLAIN QUERY PLAN ',
+}
+
+
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    """Yield successive lists of at most `size` items"""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
 
 class ArticleDB(Base):
     """Article database model"""
@@ -56,27 +97,291 @@ class ArticleDB(Base):
     # Timestamps
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
 
+    # Composite indexes matching the list endpoints' filter + ORDER BY
+    # published_at DESC, so they are served by a (backward) index scan
+    __table_args__ = (
+        Index('ix_articles_cat_pub', 'category_slug', 'published_at'),
+        Index('ix_articles_breaking_pub', 'is_breaking', 'published_at'),
+        Index('ix_articles_source_pub', 'source', 'published_at'),
+    )
+
+
+# Mapped column names, for filtering incoming article dicts
+_ARTICLE_COLUMNS = frozenset(c.key for c in ArticleDB.__mapper__.column_attrs)
+
+# Columns returned by the read endpoints, in output order
+_ARTICLE_FIELDS = (
+    ArticleDB.id,
+    ArticleDB.slug,
+    ArticleDB.source,
+    ArticleDB.source_url,
+    ArticleDB.title,
+    ArticleDB.subtitle,
+    ArticleDB.excerpt,
+    ArticleDB.content,
+    ArticleDB.category,
+    ArticleDB.category_slug,
+    ArticleDB.author,
+    ArticleDB.published_at,
+    ArticleDB.scraped_at,
+    ArticleDB.image_url,
+    ArticleDB.local_image_path,
+    ArticleDB.images,
+    ArticleDB.tags,
+    ArticleDB.keywords,
+    ArticleDB.views,
+    ArticleDB.is_breaking,
+    ArticleDB.source_type,
+    ArticleDB.meta_description,
+    ArticleDB.meta_keywords,
+)
+
+# Timestamp columns that read endpoints return as ISO-8601 strings
+_TIMESTAMP_FIELDS = ('published_at', 'scraped_at')
+
+# to_char() pattern matching datetime.isoformat() with microseconds
+_PG_ISO_FORMAT = 'YYYY-MM-DD"T"HH24:MI:SS.US'
+
+# isoformat() omits the fraction when microsecond == 0; to_char() always prints it
+_PG_ZERO_FRACTION = r'\.000000$'
+
+
+def _read_statements(fields: tuple) -> dict:
+    """
+    Build the hot read statements over `fields`
+
+    They are built once so SQLAlchemy's compiled-statement cache hits on
+    every call; per-call values are passed as bind parameters.
+    """
+    return {
+        'by_id': (
+            select(*fields)
+            .where(ArticleDB.id == bindparam('article_id'))
+        ),
+        'by_category': (
+            select(*fields)
+            .where(ArticleDB.category_slug == bindparam('category'))
+            .order_by(ArticleDB.published_at.desc())
+            .limit(bindparam('limit'))
+            .offset(bindparam('offset'))
+        ),
+        'recent': (
+            select(*fields)
+            .order_by(ArticleDB.published_at.desc())
+            .limit(bindparam('limit'))
+        ),
+        'breaking': (
+            select(*fields)
+            .where(ArticleDB.is_breaking == True)
+            .order_by(ArticleDB.published_at.desc())
+            .limit(bindparam('limit'))
+        ),
+    }
+
+
+_READ_STMTS = _read_statements(_ARTICLE_FIELDS)
+
+# PostgreSQL formats timestamps server-side, so rows arrive as ready-made
+# strings and Python never builds datetime objects for read-only results
+_PG_ARTICLE_FIELDS = tuple(
+    func.regexp_replace(func.to_char(field, _PG_ISO_FORMAT), _PG_ZERO_FRACTION, '').label(field.key)
+    if field.key in _TIMESTAMP_FIELDS else field
+    for field in _ARTICLE_FIELDS
+)
+_PG_READ_STMTS = _read_statements(_PG_ARTICLE_FIELDS)
+
+# Large text columns left out of list endpoints called with summary_only=True
+_HEAVY_FIELDS = ('content', 'meta_description', 'meta_keywords')
+
+
+def _summary_fields(fields: tuple) -> tuple:
+    """Drop the heavy text columns from a field list"""
+    return tuple(field for field in fields if field.key not in _HEAVY_FIELDS)
+
+
+_SUMMARY_READ_STMTS = _read_statements(_summary_fields(_ARTICLE_FIELDS))
+_PG_SUMMARY_READ_STMTS = _read_statements(_summary_fields(_PG_ARTICLE_FIELDS))
+
+_ARTICLE_EXISTS_STMT = (
+    select(ArticleDB.id)
+    .where(ArticleDB.source_url == bindparam('source_url'))
+    .limit(1)
+)
+
+
+def _build_upsert(dialect: str, columns: Iterable[str]):
+    """
+    Build a dialect-specific INSERT ... ON CONFLICT (source_url) DO UPDATE
+
+    Args:
+        dialect: SQLAlchemy dialect name
+        columns: Column names present in the rows being written
+
+    Returns:
+        Insert statement, or None if the dialect has no native upsert
+    """
+    if dialect == 'postgresql':
+        stmt = pg_insert(ArticleDB)
+    elif dialect == 'sqlite':
+        stmt = sqlite_insert(ArticleDB)
+    else:
+        return None
+
+    update_values = {
+        key: stmt.excluded[key]
+        for key in columns
+        if key not in ('id', 'source_url')
+    }
+    # ON CONFLICT DO UPDATE skips column onupdate hooks: reuse the Python-side
+    # updated_at default already bound for the INSERT (local time, like every path)
+    update_values['updated_at'] = stmt.excluded.updated_at
+
+    return stmt.on_conflict_do_update(
+        index_elements=['source_url'],
+        set_=update_values
+    )
+
+
+def _row_to_dict(row) -> dict:
+    """Convert a Core result row over the article fields to a dictionary"""
+    data = dict(row._mapping)
+    for key in _TIMESTAMP_FIELDS:
+        # Already a string when formatted server-side (PostgreSQL)
+        value = data[key]
+        if isinstance(value, datetime):
+            data[key] = value.isoformat()
+    data['images'] = data['images'] or []
+    data['tags'] = data['tags'] or []
+    data['keywords'] = data['keywords'] or []
+    return data
+
 
 class Database:
     """Database manager for articles"""
 
-    def __init__(self, database_url: str):
-        self.engine = create_engine(database_url, echo=False)
+    def __init__(
+        self,
+        database_url: str,
+        pool_size: int = 20,
+        max_overflow: int = 10,
+        pool_recycle: int = 3600,
+        query_cache_size: int = 1200
+    ):
+        engine_kwargs = {
+            "echo": False,
+            "query_cache_size": query_cache_size,
+            "insertmanyvalues_page_size": UPSERT_BATCH_SIZE,
+        }
+
+        if HAS_ORJSON:
+            # C serializer for the images/tags/keywords JSON columns
+            engine_kwargs["json_serializer"] = lambda obj: orjson.dumps(obj).decode()
+            engine_kwargs["json_deserializer"] = orjson.loads
+
+        if database_url.startswith("sqlite"):
+            # SQLite: one shared connection usable from any thread
+            engine_kwargs["connect_args"] = {"check_same_thread": False}
+            engine_kwargs["poolclass"] = StaticPool
+        else:
+            engine_kwargs.update(
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_pre_ping=True,  # Drop stale connections before use
+                pool_recycle=pool_recycle
+            )
+
+        self.engine = create_engine(database_url, **engine_kwargs)
         Base.metadata.create_all(self.engine)
         self.SessionLocal = sessionmaker(bind=self.engine)
+
+        if self.engine.dialect.name == 'postgresql':
+            self._article_fields = _PG_ARTICLE_FIELDS
+            self._read_stmts = _PG_READ_STMTS
+            self._summary_stmts = _PG_SUMMARY_READ_STMTS
+        else:
+            self._article_fields = _ARTICLE_FIELDS
+            self._read_stmts = _READ_STMTS
+            self._summary_stmts = _SUMMARY_READ_STMTS
+
+        # source_url -> exists, most recently used last
+        self._exists_cache: OrderedDict = OrderedDict()
+
+        # (method, args) -> (expires_at, result) for the hot read endpoints
+        self._read_cache: dict = {}
+
+        # Opt-in: DB_SLOW_QUERY_MS=50 logs statements slower than 50 ms with their plan
+        slow_query_ms = os.getenv("DB_SLOW_QUERY_MS")
+        if slow_query_ms:
+            self._install_slow_query_log(float(slow_query_ms))
+
         logger.info(f"Database initialized: {database_url.split('@')[-1]}")
 
+    def _install_slow_query_log(self, threshold_ms: float):
+        """
+        Log statements slower than threshold_ms, plus their query plan
+
+        Args:
+            threshold_ms: Minimum statement time in milliseconds to report
+        """
+        explain_prefix = _EXPLAIN_PREFIX.get(self.engine.dialect.name)
+
+        @event.listens_for(self.engine, "before_cursor_execute")
+        def _start_timer(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+        @event.listens_for(self.engine, "after_cursor_execute")
+        def _log_slow(conn, cursor, statement, parameters, context, executemany):
+            elapsed_ms = (time.perf_counter() - conn.info['query_start'].pop()) * 1000
+            if elapsed_ms < threshold_ms:
+                return
+
+            logger.warning(f"Slow query ({elapsed_ms:.1f} ms): {statement}")
+
+            if executemany or not explain_prefix or not statement.lstrip().upper().startswith('SELECT'):
+                return
+
+            # Same DBAPI connection as the statement (a raw cursor does not re-trigger
+            # these events): no pool checkout, and the caller's transaction is left
+            # untouched. On PostgreSQL a failed EXPLAIN would abort that transaction,
+            # so it runs inside a savepoint
+            dbapi_conn = cursor.connection
+            use_savepoint = self.engine.dialect.name == 'postgresql'
+            explain_cursor = dbapi_conn.cursor()
+            try:
+                if use_savepoint:
+                    explain_cursor.execute("SAVEPOINT slow_query_explain")
+                explain_cursor.execute(explain_prefix + statement, parameters)
+                plan = "\n".join(" ".join(str(col) for col in row) for row in explain_cursor.fetchall())
+                if use_savepoint:
+                    explain_cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+                logger.warning(f"Query plan:\n{plan}")
+            except Exception as e:
+                if use_savepoint:
+                    explain_cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                logger.debug(f"EXPLAIN failed: {e}")
+            finally:
+                explain_cursor.close()
+
+        logger.info(f"Slow query logging enabled (> {threshold_ms:.0f} ms)")
+
     def get_session(self) -> Session:
         """Get database session"""
         return self.SessionLocal()
 
-    def save_article(self, article_data: dict, session: Optional[Session] = None) -> bool:
+    def save_article(
+        self,
+        article_data: dict,
+        session: Optional[Session] = None,
+        existing_urls: Optional[set] = None
+    ) -> bool:
         """
         Save or update article in database
 
         Args:
             article_data: Article dictionary
             session: Optional existing session
+            existing_urls: Optional preloaded set of stored source_urls; lets
+                the non-upsert path skip its own existence SELECT
 
         Returns:
             True if successful
@@ -87,24 +392,36 @@ class Database:
             close_session = True
 
         try:
-            # Check if article exists
-            existing = session.query(ArticleDB).filter_by(
-                source_url=article_data['source_url']
-            ).first()
+            row = {key: value for key, value in article_data.items() if key in _ARTICLE_COLUMNS}
+            stmt = self._upsert_statement(row.keys())
 
-            if existing:
-                # Update existing article
-                for key, value in article_data.items():
-                    if hasattr(existing, key):
-                        setattr(existing, key, value)
-                logger.debug(f"Updated article: {article_data['title'][:50]}...")
+            if stmt is not None:
+                # Single atomic INSERT ... ON CONFLICT (source_url) DO UPDATE
+                session.execute(stmt, row)
+                logger.debug(f"Upserted article: {article_data['title'][:50]}...")
             else:
-                # Create new article
-                article = ArticleDB(**article_data)
-                session.add(article)
-                logger.debug(f"Created article: {article_data['title'][:50]}...")
+                if existing_urls is not None and article_data['source_url'] not in existing_urls:
+                    existing = None  # Known to be new: no lookup needed
+                else:
+                    # Check if article exists
+                    existing = session.query(ArticleDB).filter_by(
+                        source_url=article_data['source_url']
+                    ).first()
+
+                if existing:
+                    # Update existing article
+                    for key, value in row.items():
+                        setattr(existing, key, value)
+                    logger.debug(f"Updated article: {article_data['title'][:50]}...")
+                else:
+                    # Create new article
+                    article = ArticleDB(**row)
+                    session.add(article)
+                    logger.debug(f"Created article: {article_data['title'][:50]}...")
 
             session.commit()
+            self._remember_exists(article_data['source_url'], True)
+            self._read_cache.clear()
             return True
 
         except Exception as e:
@@ -116,198 +433,382 @@ class Database:
             if close_session:
                 session.close()
 
+    def _upsert_statement(self, columns: Iterable[str]):
+        """Build the upsert statement for this engine's dialect"""
+        return _build_upsert(self.engine.dialect.name, columns)
+
     def save_articles(self, articles_data: List[dict]) -> int:
         """
         Save multiple articles
 
+        Uses one multi-row UPSERT per batch of UPSERT_BATCH_SIZE rows (or an
+        executemany INSERT + UPDATE pair on dialects without upsert) and one
+        commit per batch, instead of a SELECT + write + commit per article.
+        A batch that fails is rolled back and retried article by article.
+
         Args:
             articles_data: List of article dictionaries
 
         Returns:
             Number of articles saved
         """
+        if not articles_data:
+            return 0
+
+        # Keyed by source_url: a statement may not touch the same row twice
+        unique_articles = {}
+        for article_data in articles_data:
+            source_url = article_data.get('source_url')
+            if not source_url:
+                logger.error(f"Skipping article without source_url: {str(article_data.get('title'))[:50]}...")
+                continue
+            unique_articles[source_url] = article_data
+
+        # Grouped by column set: a multi-row statement needs the same keys in every
+        # row, and padding missing ones with NULL would overwrite stored values
+        groups: dict = {}
+        for article_data in unique_articles.values():
+            columns = frozenset(key for key in article_data if key in _ARTICLE_COLUMNS)
+            groups.setdefault(columns, []).append(article_data)
+
         session = self.get_session()
         saved = 0
 
         try:
-            for article_data in articles_data:
-                if self.save_article(article_data, session):
-                    saved += 1
-
-            logger.info(f"Saved {saved}/{len(articles_data)} articles to database")
-            return saved
-
+            for columns, group in groups.items():
+                stmt = self._upsert_statement(columns)
+                for batch in _batched(group, UPSERT_BATCH_SIZE):
+                    saved += self._save_batch(session, stmt, batch)
         finally:
             session.close()
 
-    def get_article(self, article_id: str) -> Optional[dict]:
-        """Get article by ID"""
-        session = self.get_session()
+        if saved:
+            self._read_cache.clear()
+
+        logger.info(f"Saved {saved}/{len(articles_data)} articles to database")
+        return saved
+
+    def _save_batch(self, session: Session, stmt, batch: List[dict]) -> int:
+        """
+        Write and commit one batch of articles sharing the same columns
 
+        Args:
+            session: Session to write with
+            stmt: Upsert statement for the batch's columns (None without native upsert)
+            batch: Article dictionaries
+
+        Returns:
+            Number of articles saved
+        """
         try:
-            article = session.query(ArticleDB).filter_by(id=article_id).first()
-            if article:
-                return self._article_to_dict(article)
-            return None
+            rows = [
+                {key: value for key, value in article_data.items() if key in _ARTICLE_COLUMNS}
+                for article_data in batch
+            ]
+            if stmt is not None:
+                session.execute(stmt, rows)
+            else:
+                self._insert_or_update_batch(session, rows)
+            session.commit()
 
-        finally:
-            session.close()
+        except Exception as e:
+            # One bad row (e.g. a duplicate slug) fails the whole statement: save
+            # the batch article by article so the rest still get stored
+            session.rollback()
+            logger.warning(f"Batch of {len(batch)} articles failed, saving one by one: {e}")
+            return sum(self.save_article(article_data, session=session) for article_data in batch)
+
+        for article_data in batch:
+            self._remember_exists(article_data['source_url'], True)
+        return len(batch)
+
+    def _insert_or_update_batch(self, session: Session, rows: List[dict]):
+        """
+        Write a batch without native upsert: one IN query splits it into new
+        and existing rows, then one executemany INSERT and one UPDATE
+        """
+        table = ArticleDB.__table__
+        existing_urls = self._existing_source_urls(
+            session, [row['source_url'] for row in rows]
+        )
+
+        new_rows = [row for row in rows if row['source_url'] not in existing_urls]
+        updated_rows = [
+            {
+                '_source_url': row['source_url'],
+                **{key: value for key, value in row.items() if key not in ('id', 'source_url')}
+            }
+            for row in rows
+            if row['source_url'] in existing_urls
+        ]
+
+        if new_rows:
+            session.execute(insert(table), new_rows)
+        if updated_rows:
+            session.execute(
+                update(table).where(table.c.source_url == bindparam('_source_url')),
+                updated_rows
+            )
+
+    def get_article(self, article_id: str) -> Optional[dict]:
+        """Get article by ID"""
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                self._read_stmts['by_id'], {'article_id': article_id}
+            ).first()
+            if row:
+                return _row_to_dict(row)
+            return None
 
     def get_articles_by_category(
         self,
         category: str,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        summary_only: bool = False
     ) -> List[dict]:
-        """Get articles by category"""
-        session = self.get_session()
+        """
+        Get articles by category
 
-        try:
-            articles = (
-                session.query(ArticleDB)
-                .filter_by(category_slug=category)
-                .order_by(ArticleDB.published_at.desc())
-                .limit(limit)
-                .offset(offset)
-                .all()
+        Args:
+            category: Category slug
+            limit: Max articles returned
+            offset: Articles to skip
+            summary_only: Omit content/meta_description/meta_keywords (list views)
+        """
+        stmts = self._summary_stmts if summary_only else self._read_stmts
+
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                stmts['by_category'],
+                {'category': category, 'limit': limit, 'offset': offset}
             )
 
-            return [self._article_to_dict(a) for a in articles]
+            return [_row_to_dict(r) for r in rows]
 
-        finally:
-            session.close()
+    def get_recent_articles(self, limit: int = 50, summary_only: bool = False) -> List[dict]:
+        """Get most recent articles (without heavy text columns if summary_only)"""
+        cache_key = ('recent', limit, summary_only)
+        cached = self._read_cache_get(cache_key)
+        if cached is not None:
+            return cached
 
-    def get_recent_articles(self, limit: int = 50) -> List[dict]:
-        """Get most recent articles"""
-        session = self.get_session()
+        with self.engine.connect() as conn:
+            stmts = self._summary_stmts if summary_only else self._read_stmts
+            rows = conn.execute(stmts['recent'], {'limit': limit})
 
-        try:
-            articles = (
-                session.query(ArticleDB)
-                .order_by(ArticleDB.published_at.desc())
-                .limit(limit)
-                .all()
-            )
+            articles = [_row_to_dict(r) for r in rows]
+            self._read_cache_set(cache_key, articles)
+            return articles
 
-            return [self._article_to_dict(a) for a in articles]
+    def get_breaking_news(self, limit: int = 10, summary_only: bool = False) -> List[dict]:
+        """Get breaking news articles (without heavy text columns if summary_only)"""
+        cache_key = ('breaking', limit, summary_only)
+        cached = self._read_cache_get(cache_key)
+        if cached is not None:
+            return cached
 
-        finally:
-            session.close()
+        with self.engine.connect() as conn:
+            stmts = self._summary_stmts if summary_only else self._read_stmts
+            rows = conn.execute(stmts['breaking'], {'limit': limit})
 
-    def get_breaking_news(self, limit: int = 10) -> List[dict]:
-        """Get breaking news articles"""
-        session = self.get_session()
+            articles = [_row_to_dict(r) for r in rows]
+            self._read_cache_set(cache_key, articles)
+            return articles
 
-        try:
-            articles = (
-                session.query(ArticleDB)
-                .filter_by(is_breaking=True)
-                .order_by(ArticleDB.published_at.desc())
-                .limit(limit)
-                .all()
-            )
+    def stream_articles(self, filter_expr=None, chunk: int = 1000) -> Iterator[dict]:
+        """
+        Iterate over all (or filtered) articles with bounded memory
 
-            return [self._article_to_dict(a) for a in articles]
+        Uses a server-side cursor where the driver supports it (e.g. a
+        psycopg2 named cursor), fetching `chunk` rows at a time.
 
-        finally:
-            session.close()
+        Args:
+            filter_expr: Optional WHERE clause, e.g. ArticleDB.published_at < cutoff
+            chunk: Rows fetched per round trip
 
-    def article_exists(self, source_url: str) -> bool:
-        """Check if article exists by URL"""
-        session = self.get_session()
+        Yields:
+            Article dictionaries ordered by published_at
+        """
+        stmt = select(*self._article_fields).order_by(ArticleDB.published_at)
+        if filter_expr is not None:
+            stmt = stmt.where(filter_expr)
 
-        try:
-            exists = (
-                session.query(ArticleDB)
-                .filter_by(source_url=source_url)
-                .first()
-            ) is not None
+        with self.engine.connect() as conn:
+            result = conn.execution_options(
+                stream_results=True,
+                yield_per=chunk
+            ).execute(stmt)
 
+            for row in result:
+                yield _row_to_dict(row)
+
+    def article_exists(self, source_url: str, cache: bool = True) -> bool:
+        """
+        Check if article exists by URL
+
+        Args:
+            source_url: Original article URL
+            cache: Answer from (and populate) the in-process LRU cache
+
+        Returns:
+            True if an article with this source_url is stored
+        """
+        if cache and source_url in self._exists_cache:
+            self._exists_cache.move_to_end(source_url)
+            return self._exists_cache[source_url]
+
+        with self.engine.connect() as conn:
+            exists = conn.execute(
+                _ARTICLE_EXISTS_STMT, {'source_url': source_url}
+            ).first() is not None
+
+            if cache:
+                self._remember_exists(source_url, exists)
             return exists
 
-        finally:
-            session.close()
+    def preload_exists_cache(self, source_urls: List[str]) -> int:
+        """
+        Seed the article_exists cache for a batch of candidate URLs
 
-    def get_stats(self) -> dict:
-        """Get database statistics"""
-        session = self.get_session()
+        Args:
+            source_urls: URLs about to be checked (e.g. at crawl start)
 
-        try:
-            total = session.query(ArticleDB).count()
+        Returns:
+            Number of URLs already stored
+        """
+        with self.engine.connect() as conn:
+            found = self._existing_source_urls(conn, source_urls)
 
-            by_category = {}
-            categories = session.query(ArticleDB.category_slug).distinct().all()
+        for url in source_urls:
+            self._remember_exists(url, url in found)
 
-            for (category,) in categories:
-                count = session.query(ArticleDB).filter_by(category_slug=category).count()
-                by_category[category] = count
+        return len(found)
 
-            by_source = {}
-            sources = session.query(ArticleDB.source).distinct().all()
+    def _existing_source_urls(self, conn, source_urls: Iterable[str]) -> set:
+        """
+        Return which of `source_urls` are already stored
+
+        Args:
+            conn: Connection or Session to query with
+            source_urls: Candidate URLs
+
+        Returns:
+            Set of stored URLs, found with one IN query per UPSERT_BATCH_SIZE URLs
+        """
+        found = set()
+        for batch in _batched(set(source_urls), UPSERT_BATCH_SIZE):
+            found.update(conn.scalars(
+                select(ArticleDB.source_url)
+                .where(ArticleDB.source_url.in_(batch))
+            ))
+        return found
+
+    def _remember_exists(self, source_url: str, exists: bool):
+        """Record an existence result in the LRU cache, evicting the oldest"""
+        self._exists_cache[source_url] = exists
+        self._exists_cache.move_to_end(source_url)
+        if len(self._exists_cache) > EXISTS_CACHE_SIZE:
+            self._exists_cache.popitem(last=False)
+
+    def get_stats(self) -> dict:
+        """Get database statistics"""
+        cached = self._read_cache_get(('stats',))
+        if cached is not None:
+            return cached
 
-            for (source,) in sources:
-                count = session.query(ArticleDB).filter_by(source=source).count()
-                by_source[source] = count
+        with self.engine.connect() as conn:
+            # One GROUP BY per dimension instead of a COUNT per distinct value
+            by_category = dict(conn.execute(
+                select(ArticleDB.category_slug, func.count())
+                .group_by(ArticleDB.category_slug)
+            ).all())
 
-            return {
+            by_source = dict(conn.execute(
+                select(ArticleDB.source, func.count())
+                .group_by(ArticleDB.source)
+            ).all())
+
+            total = sum(by_category.values())
+
+            stats = {
                 'total_articles': total,
                 'by_category': by_category,
                 'by_source': by_source
             }
+            self._read_cache_set(('stats',), stats)
+            return stats
 
-        finally:
-            session.close()
+    def _read_cache_get(self, key: tuple) -> Optional[Any]:
+        """Return a cached read result, or None if missing or expired"""
+        entry = self._read_cache.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._read_cache[key]
+            return None
+        return value
+
+    def _read_cache_set(self, key: tuple, value: Any):
+        """Cache a read result for READ_CACHE_TTL seconds"""
+        if len(self._read_cache) >= READ_CACHE_SIZE:
+            self._read_cache.clear()
+        self._read_cache[key] = (time.monotonic() + READ_CACHE_TTL, value)
+
+    def cleanup_old_articles(self, days: int = 90, batch_size: int = 5000) -> int:
+        """
+        Delete articles older than specified days
+
+        Deletes in bounded batches, committing after each one, so no single
+        transaction holds locks on the table for long.
+
+        Args:
+            days: Age threshold in days
+            batch_size: Max rows removed per transaction
+
+        Returns:
+            Number of articles deleted
+        """
+        from datetime import timedelta
+        cutoff_date = datetime.now() - timedelta(days=days)
+        is_old = ArticleDB.published_at < cutoff_date
+
+        if self.engine.dialect.name == 'mysql':
+            stmt = delete(ArticleDB).where(is_old).with_dialect_options(mysql_limit=batch_size)
+        else:
+            # PostgreSQL/SQLite have no DELETE ... LIMIT: bound it via the primary key
+            old_ids = select(ArticleDB.id).where(is_old).limit(batch_size)
+            stmt = delete(ArticleDB).where(ArticleDB.id.in_(old_ids.scalar_subquery()))
 
-    def cleanup_old_articles(self, days: int = 90) -> int:
-        """Delete articles older than specified days"""
         session = self.get_session()
+        deleted = 0
 
         try:
-            from datetime import timedelta
-            cutoff_date = datetime.now() - timedelta(days=days)
+            while True:
+                result = session.execute(stmt)
+                session.commit()
 
-            deleted = (
-                session.query(ArticleDB)
-                .filter(ArticleDB.published_at < cutoff_date)
-                .delete()
-            )
+                if result.rowcount <= 0:
+                    break
+
+                deleted += result.rowcount
+                logger.debug(f"Deleted {deleted} old articles so far...")
+
+                if result.rowcount < batch_size:
+                    break
 
-            session.commit()
             logger.info(f"Deleted {deleted} old articles")
             return deleted
 
         except Exception as e:
             session.rollback()
             logger.error(f"Error cleaning up old articles: {e}")
-            return 0
+            return deleted
 
         finally:
+            if deleted:
+                self._exists_cache.clear()
+                self._read_cache.clear()
             session.close()
-
-    def _article_to_dict(self, article: ArticleDB) -> dict:
-        """Convert article model to dictionary"""
-        return {
-            'id': article.id,
-            'slug': article.slug,
-            'source': article.source,
-            'source_url': article.source_url,
-            'title': article.title,
-            'subtitle': article.subtitle,
-            'excerpt': article.excerpt,
-            'content': article.content,
-            'category': article.category,
-            'category_slug': article.category_slug,
-            'author': article.author,
-            'published_at': article.published_at.isoformat() if article.published_at else None,
-            'scraped_at': article.scraped_at.isoformat() if article.scraped_at else None,
-            'image_url': article.image_url,
-            'local_image_path': article.local_image_path,
-            'images': article.images or [],
-            'tags': article.tags or [],
-            'keywords': article.keywords or [],
-            'views': article.views,
-            'is_breaking': article.is_breaking,
-            'source_type': article.source_type,
-            'meta_description': article.meta_description,
-            'meta_keywords': article.meta_keywords
-        }
@@ -2,11 +2,80 @@
 Supabase storage - Reemplaza PostgreSQL y Redis
 Almacena noticias directamente en Supabase
 """
+import asyncio
+import json
+import mimetypes
+import random
+import time
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
+from urllib.parse import quote
 import httpx
 from loguru import logger
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import h2  # noqa: F401  (httpx[http2])
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serializar a JSON (orjson si está disponible)"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Parsear JSON (orjson si está disponible)"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Filas por request en el upsert masivo de save_articles
+UPSERT_BATCH_SIZE = 500
+
+# Endpoints PostgREST (relativos al base_url del cliente)
+_URL_NOTICIAS = "/rest/v1/noticias"
+_URL_CATEGORIAS = "/rest/v1/categorias"
+_URL_USUARIOS = "/rest/v1/usuarios"
+_URL_STATS_RPC = "/rest/v1/rpc/noticias_stats"
+
+# Límites por request de existing_source_urls (la URL completa debe quedar bajo ~8 KB)
+EXISTS_CHUNK_SIZE = 200
+EXISTS_QUERY_MAX_CHARS = 6000
+
+# Reintentos ante fallos transitorios (timeouts, conexión, 502/503/504)
+RETRY_ATTEMPTS = 4
+RETRY_BASE_DELAY = 0.2
+RETRY_STATUS_CODES = {502, 503, 504}
+# Fallos en los que el request nunca llegó a enviarse: seguros de reintentar siempre
+RETRY_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# TTL (segundos) de las listas cacheadas en memoria (recientes, última hora, por categoría)
+READ_CACHE_TTL = 30
+
+# Tamaño de bloque al subir imágenes en streaming
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _content_range_total(response: httpx.Response) -> int:
+    """Leer el total de filas del header Content-Range (requiere Prefer: count=exact)"""
+    content_range = response.headers.get("Content-Range", "")
+    if "/" in content_range:
+        total = content_range.split("/")[1]
+        if total.isdigit():
+            return int(total)
+    return 0
+
 
 class SupabaseStorage:
     """Storage manager usando solo Supabase (reemplaza Database + Cache)"""
@@ -15,34 +84,147 @@ class SupabaseStorage:
         self,
         supabase_url: str,
         supabase_key: str,
-        storage_bucket: str = "noticias"  # Bucket de Supabase Storage
+        storage_bucket: str = "noticias",  # Bucket de Supabase Storage
+        max_concurrency: int = 16  # Requests simultáneos en operaciones masivas
     ):
         self.supabase_url = supabase_url.rstrip('/')
         self.supabase_key = supabase_key
         self.storage_bucket = storage_bucket
         self.timeout = 30
+        self._semaphore = asyncio.Semaphore(max_concurrency)
 
+        # Sin "Prefer": PostgREST usa return=minimal por defecto y no serializa
+        # las filas escritas; solo se pide representation donde se usa la respuesta
         self.headers = {
             "apikey": supabase_key,
             "Authorization": f"Bearer {supabase_key}",
-            "Content-Type": "application/json",
-            "Prefer": "return=representation"
+            "Content-Type": "application/json"
         }
+        # Variantes de headers precalculadas para no rearmar dicts en cada request
+        self._h_count = {**self.headers, "Prefer": "count=exact"}
+        self._h_upsert = {**self.headers, "Prefer": "resolution=merge-duplicates,return=minimal"}
+        self._h_repr = {**self.headers, "Prefer": "return=representation"}
+
+        # Caché en proceso: las categorías y el autor del scraper casi nunca cambian
+        self._category_cache: Dict[str, str] = {}
+        self._category_lock = asyncio.Lock()
+        self._default_author_id: Optional[str] = None
+        self._author_lock = asyncio.Lock()
+        self._mem_cache: Dict[str, tuple] = {}  # key -> (expira_en, valor)
+
+        # Cliente HTTP persistente: reutiliza conexiones TCP/TLS entre llamadas.
+        # Con HTTP/2 los requests concurrentes se multiplexan sobre pocas conexiones.
+        if HAS_HTTP2:
+            limits = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+        else:
+            limits = httpx.Limits(max_connections=120, max_keepalive_connections=80)
+
+        self.client = httpx.AsyncClient(
+            base_url=self.supabase_url,
+            timeout=self.timeout,
+            http2=HAS_HTTP2,
+            limits=limits
+        )
+
+        logger.info(f"SupabaseStorage initialized: {self.supabase_url} (HTTP/2: {HAS_HTTP2})")
+
+    async def close(self):
+        """Cerrar el cliente HTTP compartido"""
+        await self.client.aclose()
+
+    async def warmup(self):
+        """Abrir la conexión (TLS + ALPN) a Supabase antes del primer request real"""
+        try:
+            await self.client.get("/rest/v1/", headers=self.headers, timeout=5)
+        except Exception as e:
+            logger.debug(f"Supabase warmup failed: {e}")
+
+    async def _request(
+        self, method: str, url: str, idempotent: Optional[bool] = None, **kwargs
+    ) -> httpx.Response:
+        """
+        Request con reintentos y backoff exponencial con jitter
+
+        Reintenta timeouts, errores de conexión y respuestas 502/503/504; el
+        jitter evita que varios workers reintenten todos al mismo tiempo.
+
+        Un POST sin merge-duplicates (p. ej. crear el autor) no es idempotente: tras un
+        timeout de lectura/escritura o un 502/504 el servidor pudo haberlo aplicado, así
+        que solo se reintenta si el request nunca se envió. `idempotent` fuerza el modo
+        (p. ej. una RPC de solo lectura por POST).
+        """
+        if idempotent is None:
+            prefer = (kwargs.get("headers") or {}).get("Prefer", "")
+            idempotent = method != "POST" or "merge-duplicates" in prefer
+        retry_errors = (httpx.TimeoutException, httpx.ConnectError) if idempotent else RETRY_UNSENT_ERRORS
+
+        for attempt in range(RETRY_ATTEMPTS):
+            try:
+                response = await self.client.request(method, url, **kwargs)
+                if (
+                    not idempotent
+                    or response.status_code not in RETRY_STATUS_CODES
+                    or attempt == RETRY_ATTEMPTS - 1
+                ):
+                    return response
+                reason = f"HTTP {response.status_code}"
+            except retry_errors as e:
+                if attempt == RETRY_ATTEMPTS - 1:
+                    raise
+                reason = repr(e)
+
+            wait_time = RETRY_BASE_DELAY * (2 ** attempt) + random.uniform(0, RETRY_BASE_DELAY)
+            logger.warning(f"⚠️ {method} {url} failed ({reason}), retrying in {wait_time:.2f}s...")
+            await asyncio.sleep(wait_time)
+
+    async def prefetch_categories(self) -> int:
+        """
+        Cargar todas las categorías en la caché con una sola consulta
 
-        logger.info(f"SupabaseStorage initialized: {self.supabase_url}")
+        Returns:
+            Número de categorías cargadas
+        """
+        try:
+            response = await self._request(
+                "GET",
+                _URL_CATEGORIAS,
+                params={"select": "id,slug"},
+                headers=self.headers
+            )
+
+            if response.status_code == 200:
+                for row in _loads(response.content):
+                    self._category_cache[row["slug"]] = row["id"]
+            return len(self._category_cache)
+
+        except Exception as e:
+            logger.error(f"Error prefetching categories: {e}")
+            return 0
 
     async def _get_category_id(self, category_slug: str) -> Optional[str]:
-        """Obtener ID de categoría por slug"""
+        """Obtener ID de categoría por slug (cacheado en memoria)"""
+        category_id = self._category_cache.get(category_slug)
+        if category_id:
+            return category_id
+
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.supabase_url}/rest/v1/categorias?slug=eq.{category_slug}&select=id",
+            async with self._category_lock:
+                # Otra tarea pudo haberla resuelto mientras esperábamos el lock
+                category_id = self._category_cache.get(category_slug)
+                if category_id:
+                    return category_id
+
+                response = await self._request(
+                    "GET",
+                    _URL_CATEGORIAS,
+                    params={"slug": f"eq.{category_slug}", "select": "id"},
                     headers=self.headers
                 )
 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = _loads(response.content)
                     if data:
+                        self._category_cache[category_slug] = data[0]["id"]
                         return data[0]["id"]
                 return None
 
@@ -51,44 +233,116 @@ class SupabaseStorage:
             return None
 
     async def _get_or_create_author(self, author_name: str = "Redacción") -> Optional[str]:
-        """Obtener o crear autor para noticias del scraper"""
+        """Obtener o crear autor para noticias del scraper (cacheado tras la primera llamada)"""
+        if self._default_author_id:
+            return self._default_author_id
+
+        async with self._author_lock:
+            if not self._default_author_id:
+                self._default_author_id = await self._fetch_or_create_author()
+        return self._default_author_id
+
+    async def _fetch_or_create_author(self) -> Optional[str]:
+        """Buscar el autor del scraper en Supabase y crearlo si no existe"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Buscar autor existente
-                response = await client.get(
-                    f"{self.supabase_url}/rest/v1/usuarios?email=eq.scraper@politicaargentina.com&select=id",
+            # Buscar autor existente
+            response = await self._request(
+                "GET",
+                _URL_USUARIOS,
+                params={"email": "eq.scraper@politicaargentina.com", "select": "id"},
+                headers=self.headers
+            )
+
+            if response.status_code == 200:
+                data = _loads(response.content)
+                if data:
+                    return data[0]["id"]
+
+            # Crear autor si no existe (siempre "Redacción")
+            author_data = {
+                "email": "scraper@politicaargentina.com",
+                "name": "Redacción",  # Siempre "Redacción", sin referencias a fuentes
+                "role": "author"
+            }
+
+            response = await self._request(
+                "POST",
+                _URL_USUARIOS,
+                headers=self._h_repr,
+                content=_dumps(author_data)
+            )
+
+            if response.status_code in [200, 201]:
+                data = _loads(response.content)
+                if isinstance(data, list) and data:
+                    return data[0]["id"]
+                elif isinstance(data, dict):
+                    return data["id"]
+            return None
+
+        except Exception as e:
+            logger.error(f"Error getting/creating author: {e}")
+            return None
+
+    async def _get_category_ids(self, category_slugs) -> Dict[str, str]:
+        """Resolver varios slugs de categoría; solo consulta los que no están en caché"""
+        slugs = {slug for slug in category_slugs if slug}
+        missing = sorted(slug for slug in slugs if slug not in self._category_cache)
+
+        if missing:
+            try:
+                response = await self._request(
+                    "GET",
+                    _URL_CATEGORIAS,
+                    params={"slug": f"in.({','.join(missing)})", "select": "id,slug"},
                     headers=self.headers
                 )
 
                 if response.status_code == 200:
-                    data = response.json()
-                    if data:
-                        return data[0]["id"]
-
-                # Crear autor si no existe (siempre "Redacción")
-                author_data = {
-                    "email": "scraper@politicaargentina.com",
-                    "name": "Redacción",  # Siempre "Redacción", sin referencias a fuentes
-                    "role": "author"
-                }
+                    for row in _loads(response.content):
+                        self._category_cache[row["slug"]] = row["id"]
+
+            except Exception as e:
+                logger.error(f"Error getting category IDs: {e}")
+
+        return {slug: self._category_cache[slug] for slug in slugs if slug in self._category_cache}
+
+    @staticmethod
+    def _row_template(author_id: str) -> dict:
+        """Campos comunes a todas las filas de un lote (se arma una vez por lote)"""
+        # source_type: 0x00 (0) = scraper + LLM, 0x01 (1) = manual
+        return {
+            "author_id": author_id,  # REQUERIDO por el schema
+            "status": "published",  # Noticias del scraper se publican automáticamente
+            "source_type": 0,  # 0x00 = scraper automático con LLM rewriting
+            "published_at": datetime.now().isoformat()  # Si el artículo no trae fecha
+        }
 
-                response = await client.post(
-                    f"{self.supabase_url}/rest/v1/usuarios",
-                    headers=self.headers,
-                    json=author_data
-                )
+    @staticmethod
+    def _to_supabase_row(article_data: dict, category_id: str, template: dict) -> dict:
+        """Convertir un artículo del scraper al formato de la tabla noticias"""
+        row = {
+            **template,
+            "title": article_data["title"],
+            "subtitle": article_data.get("subtitle"),
+            "slug": article_data["slug"],
+            "category_id": category_id,
+            "excerpt": article_data["excerpt"],
+            "content": article_data.get("content", ""),
+            "image_url": article_data.get("image_url", ""),
+            "views": article_data.get("views", 0),
+            "is_breaking": article_data.get("is_breaking", False),
+            "source_url": article_data.get("source_url") or None  # URL original (clave del upsert)
+        }
 
-                if response.status_code in [200, 201]:
-                    data = response.json()
-                    if isinstance(data, list) and data:
-                        return data[0]["id"]
-                    elif isinstance(data, dict):
-                        return data["id"]
-                return None
+        # Convertir published_at a ISO string si es datetime
+        published_at = article_data.get("published_at")
+        if isinstance(published_at, datetime):
+            row["published_at"] = published_at.isoformat()
+        elif published_at:
+            row["published_at"] = published_at
 
-        except Exception as e:
-            logger.error(f"Error getting/creating author: {e}")
-            return None
+        return row
 
     async def save_article(self, article_data: dict) -> bool:
         """
@@ -100,80 +354,14 @@ class SupabaseStorage:
         Returns:
             True si fue exitoso
         """
-        try:
-            # Obtener IDs necesarios
-            category_id = await self._get_category_id(article_data.get("category_slug", ""))
-            if not category_id:
-                logger.error(f"Category not found: {article_data.get('category_slug')}")
-                return False
-
-            # Obtener o crear autor (requerido por el schema)
-            author_id = await self._get_or_create_author("Redacción")
-            if not author_id:
-                logger.error(f"Failed to get or create author")
-                return False
-
-            # Convertir published_at a ISO string si es datetime
-            published_at = article_data.get("published_at")
-            if published_at and isinstance(published_at, datetime):
-                published_at = published_at.isoformat()
-            elif published_at is None:
-                published_at = datetime.now().isoformat()
-
-            # Preparar datos para Supabase (formato noticias)
-            # source_type: 0x00 (0) = scraper + LLM, 0x01 (1) = manual
-            supabase_data = {
-                "title": article_data["title"],
-                "subtitle": article_data.get("subtitle"),
-                "slug": article_data["slug"],
-                "category_id": category_id,
-                "author_id": author_id,  # REQUERIDO por el schema
-                "excerpt": article_data["excerpt"],
-                "content": article_data.get("content", ""),
-                "image_url": article_data.get("image_url", ""),
-                "views": article_data.get("views", 0),
-                "status": "published",  # Noticias del scraper se publican automáticamente
-                "is_breaking": article_data.get("is_breaking", False),
-                "source_type": 0,  # 0x00 = scraper automático con LLM rewriting
-                "source_url": article_data.get("source_url", ""),  # URL original del artículo
-                "published_at": published_at
-            }
-
-            # Insertar nuevo artículo (ya verificamos duplicados antes de llamar a save_article)
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Crear nuevo artículo
-                insert_response = await client.post(
-                    f"{self.supabase_url}/rest/v1/noticias",
-                    headers=self.headers,
-                    json=supabase_data
-                )
-                
-                if insert_response.status_code in [200, 201]:
-                    logger.info(f"✅ Created article: {article_data['title'][:50]}... (source_type: 0x00)")
-                    return True
-                else:
-                    # Si falla por duplicado, intentar actualizar
-                    if insert_response.status_code == 409 or 'duplicate' in str(insert_response.text).lower():
-                        logger.debug(f"Article exists, updating: {article_data['title'][:50]}...")
-                        update_response = await client.patch(
-                            f"{self.supabase_url}/rest/v1/noticias?slug=eq.{article_data['slug']}",
-                            headers=self.headers,
-                            json=supabase_data
-                        )
-                        if update_response.status_code in [200, 204]:
-                            logger.debug(f"Updated article: {article_data['title'][:50]}...")
-                            return True
-
-                logger.error(f"Failed to save article: {article_data['title'][:50]}... Status: {insert_response.status_code}, Response: {insert_response.text}")
-                return False
-
-        except Exception as e:
-            logger.error(f"Error saving article to Supabase: {e}")
-            return False
+        return await self.save_articles([article_data]) == 1
 
     async def save_articles(self, articles_data: List[dict]) -> int:
         """
-        Guardar múltiples artículos
+        Guardar múltiples artículos con un upsert masivo de PostgREST
+
+        Las categorías y el autor se resuelven una sola vez por lote y cada
+        bloque de UPSERT_BATCH_SIZE filas se envía en un único POST.
 
         Args:
             articles_data: Lista de diccionarios de artículos
@@ -181,28 +369,130 @@ class SupabaseStorage:
         Returns:
             Número de artículos guardados
         """
+        if not articles_data:
+            return 0
+
         saved = 0
 
-        for article_data in articles_data:
-            if await self.save_article(article_data):
-                saved += 1
+        try:
+            # Categorías y autor (requerido por el schema) son independientes: resolver en paralelo
+            category_ids, author_id = await asyncio.gather(
+                self._get_category_ids(
+                    article_data.get("category_slug", "") for article_data in articles_data
+                ),
+                self._get_or_create_author("Redacción")
+            )
+            if not author_id:
+                logger.error("Failed to get or create author")
+                return 0
+
+            template = self._row_template(author_id)
+
+            # Indexar por source_url (o slug si falta): PostgREST rechaza un lote
+            # que actualiza la misma fila dos veces
+            rows = {}
+            for article_data in articles_data:
+                category_id = category_ids.get(article_data.get("category_slug", ""))
+                if not category_id:
+                    logger.error(f"Category not found: {article_data.get('category_slug')}")
+                    continue
+                key = article_data.get("source_url") or article_data["slug"]
+                rows[key] = self._to_supabase_row(article_data, category_id, template)
+
+            rows = list(rows.values())
+            batches = [
+                rows[start:start + UPSERT_BATCH_SIZE]
+                for start in range(0, len(rows), UPSERT_BATCH_SIZE)
+            ]
+
+            # Los lotes son independientes: enviarlos en paralelo (acotado por el semáforo)
+            results = await asyncio.gather(
+                *(self._upsert_batch(batch) for batch in batches),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error saving batch to Supabase: {result}")
+                else:
+                    saved += result
+
+        except Exception as e:
+            logger.error(f"Error saving articles to Supabase: {e}")
+
+        if saved:
+            # Las listas cacheadas ya no reflejan lo guardado
+            self._mem_cache.clear()
 
         logger.info(f"Saved {saved}/{len(articles_data)} articles to Supabase")
         return saved
 
+    async def _upsert_batch(self, batch: List[dict]) -> int:
+        """Insertar o actualizar (por source_url) un lote de filas en un solo request"""
+        async with self._semaphore:
+            response = await self._request(
+                "POST",
+                _URL_NOTICIAS,
+                params={"on_conflict": "source_url"},
+                headers=self._h_upsert,
+                content=_dumps(batch)
+            )
+
+        if response.status_code in [200, 201, 204]:
+            return len(batch)
+
+        if len(batch) > 1 and 400 <= response.status_code < 500:
+            # Una sola fila en conflicto (p.ej. un slug repetido con otra source_url) hace
+            # fallar el lote entero: reintentar fila por fila para no perder las demás
+            logger.warning(
+                f"Batch of {len(batch)} articles rejected (Status: {response.status_code}), "
+                f"retrying row by row"
+            )
+            results = await asyncio.gather(*(self._upsert_row(row) for row in batch))
+            return sum(results)
+
+        logger.error(f"Failed to save {len(batch)} articles. Status: {response.status_code}, Response: {response.text}")
+        return 0
+
+    async def _upsert_row(self, row: dict) -> int:
+        """Upsert de una fila; si su slug ya lo usa otra noticia, actualizarla por slug"""
+        async with self._semaphore:
+            response = await self._request(
+                "POST",
+                _URL_NOTICIAS,
+                params={"on_conflict": "source_url"},
+                headers=self._h_upsert,
+                content=_dumps([row])
+            )
+            if response.status_code == 409:
+                logger.debug(f"Slug already exists, updating: {row['title'][:50]}...")
+                response = await self._request(
+                    "PATCH",
+                    _URL_NOTICIAS,
+                    params={"slug": f"eq.{row['slug']}"},
+                    headers=self.headers,
+                    content=_dumps(row)
+                )
+
+        if response.status_code in [200, 201, 204]:
+            return 1
+
+        logger.error(f"Failed to save article: {row['title'][:50]}... Status: {response.status_code}, Response: {response.text}")
+        return 0
+
     async def article_exists(self, slug: str) -> bool:
         """Verificar si artículo existe por slug (DEPRECATED - usar article_exists_by_source_url)"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.supabase_url}/rest/v1/noticias?slug=eq.{slug}&select=id",
-                    headers=self.headers
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return len(data) > 0
-                return False
+            response = await self._request(
+                "GET",
+                _URL_NOTICIAS,
+                params={"slug": f"eq.{slug}", "select": "id"},
+                headers=self.headers
+            )
+
+            if response.status_code == 200:
+                data = _loads(response.content)
+                return len(data) > 0
+            return False
 
         except Exception as e:
             logger.error(f"Error checking article existence: {e}")
@@ -217,37 +507,100 @@ class SupabaseStorage:
             if not source_url:
                 return False
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.supabase_url}/rest/v1/noticias?source_url=eq.{source_url}&select=id",
-                    headers=self.headers
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    exists = len(data) > 0
-                    if exists:
-                        logger.debug(f"Article already exists with source_url: {source_url[:60]}...")
-                    return exists
-                return False
+            # HEAD + count=exact: la respuesta no trae body, solo Content-Range
+            response = await self._request(
+                "HEAD",
+                _URL_NOTICIAS,
+                params={"source_url": f"eq.{source_url}", "select": "id", "limit": 1},
+                headers=self._h_count
+            )
+
+            if response.status_code in [200, 206]:
+                exists = _content_range_total(response) > 0
+                if exists:
+                    logger.debug(f"Article already exists with source_url: {source_url[:60]}...")
+                return exists
+            return False
 
         except Exception as e:
             logger.error(f"Error checking article existence by source_url: {e}")
             return False
 
+    async def existing_source_urls(self, urls: List[str]) -> set:
+        """
+        Obtener cuáles de las URLs dadas ya existen en Supabase
+
+        Las URLs van en filtros source_url=in.(...); como la URL completa del
+        request no debe pasar de ~8 KB (límite habitual de PostgREST y su
+        proxy), se parten en grupos de hasta EXISTS_CHUNK_SIZE valores y
+        EXISTS_QUERY_MAX_CHARS caracteres codificados, consultados en paralelo.
+
+        Args:
+            urls: Lista de source_url a verificar
+
+        Returns:
+            Conjunto de source_url ya guardados
+        """
+        urls = [url for url in dict.fromkeys(urls) if url]
+        if not urls:
+            return set()
+
+        # PostgREST: los valores de in.() con comas o paréntesis van entre comillas dobles
+        quoted = ['"' + url.replace('\\', '\\\\').replace('"', '\\"') + '"' for url in urls]
+
+        chunks, chunk, chunk_chars = [], [], 0
+        for value in quoted:
+            value_chars = len(quote(value, safe="")) + 3  # + coma codificada
+            if chunk and (len(chunk) >= EXISTS_CHUNK_SIZE or chunk_chars + value_chars > EXISTS_QUERY_MAX_CHARS):
+                chunks.append(chunk)
+                chunk, chunk_chars = [], 0
+            chunk.append(value)
+            chunk_chars += value_chars
+        chunks.append(chunk)
+
+        results = await asyncio.gather(
+            *(self._existing_source_urls_chunk(chunk) for chunk in chunks),
+            return_exceptions=True
+        )
+
+        existing = set()
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error checking existing source_urls: {result}")
+            else:
+                existing |= result
+        return existing
+
+    async def _existing_source_urls_chunk(self, quoted: List[str]) -> set:
+        """Consultar un grupo de valores ya entrecomillados con un solo request"""
+        async with self._semaphore:
+            response = await self._request(
+                "GET",
+                _URL_NOTICIAS,
+                params={"source_url": f"in.({','.join(quoted)})", "select": "source_url"},
+                headers=self.headers
+            )
+
+        if response.status_code == 200:
+            return {row["source_url"] for row in _loads(response.content)}
+
+        logger.error(f"Failed to check existing source_urls: {response.status_code} - {response.text}")
+        return set()
+
     async def article_exists_by_slug(self, slug: str) -> bool:
         """Verificar si artículo existe por slug"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.supabase_url}/rest/v1/noticias?slug=eq.{slug}&select=id",
-                    headers=self.headers
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return len(data) > 0
-                return False
+            response = await self._request(
+                "GET",
+                _URL_NOTICIAS,
+                params={"slug": f"eq.{slug}", "select": "id"},
+                headers=self.headers
+            )
+
+            if response.status_code == 200:
+                data = _loads(response.content)
+                return len(data) > 0
+            return False
 
         except Exception as e:
             logger.error(f"Error checking article existence by slug: {e}")
@@ -259,119 +612,178 @@ class SupabaseStorage:
         limit: int = 50,
         offset: int = 0
     ) -> List[dict]:
-        """Obtener artículos por categoría"""
+        """Obtener artículos por categoría (cacheado READ_CACHE_TTL segundos)"""
+        cache_key = f"category:{category_slug}:{limit}:{offset}"
+        cached = await self.cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Primero obtener category_id
             category_id = await self._get_category_id(category_slug)
             if not category_id:
                 return []
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.supabase_url}/rest/v1/noticias?category_id=eq.{category_id}&status=eq.published&order=published_at.desc&limit={limit}&offset={offset}",
-                    headers=self.headers
-                )
-
-                if response.status_code == 200:
-                    return response.json()
-                return []
+            response = await self._request(
+                "GET",
+                _URL_NOTICIAS,
+                params={
+                    "category_id": f"eq.{category_id}",
+                    "status": "eq.published",
+                    "order": "published_at.desc",
+                    "limit": limit,
+                    "offset": offset
+                },
+                headers=self.headers
+            )
+
+            if response.status_code == 200:
+                articles = _loads(response.content)
+                await self.cache_set(cache_key, articles, ttl=READ_CACHE_TTL)
+                return articles
+            return []
 
         except Exception as e:
             logger.error(f"Error getting articles by category: {e}")
             return []
 
     async def get_recent_articles(self, limit: int = 50) -> List[dict]:
-        """Obtener artículos más recientes"""
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.supabase_url}/rest/v1/noticias?status=eq.published&order=published_at.desc&limit={limit}",
-                    headers=self.headers
-                )
+        """Obtener artículos más recientes (cacheado READ_CACHE_TTL segundos)"""
+        cache_key = f"recent:{limit}"
+        cached = await self.cache_get(cache_key)
+        if cached is not None:
+            return cached
 
-                if response.status_code == 200:
-                    return response.json()
-                return []
+        try:
+            response = await self._request(
+                "GET",
+                _URL_NOTICIAS,
+                params={"status": "eq.published", "order": "published_at.desc", "limit": limit},
+                headers=self.headers
+            )
+
+            if response.status_code == 200:
+                articles = _loads(response.content)
+                await self.cache_set(cache_key, articles, ttl=READ_CACHE_TTL)
+                return articles
+            return []
 
         except Exception as e:
             logger.error(f"Error getting recent articles: {e}")
             return []
 
     async def get_breaking_news(self, limit: int = 10) -> List[dict]:
-        """Obtener noticias de última hora"""
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.supabase_url}/rest/v1/noticias?is_breaking=eq.true&status=eq.published&order=published_at.desc&limit={limit}",
-                    headers=self.headers
-                )
+        """Obtener noticias de última hora (cacheado READ_CACHE_TTL segundos)"""
+        cache_key = f"breaking:{limit}"
+        cached = await self.cache_get(cache_key)
+        if cached is not None:
+            return cached
 
-                if response.status_code == 200:
-                    return response.json()
-                return []
+        try:
+            response = await self._request(
+                "GET",
+                _URL_NOTICIAS,
+                params={
+                    "is_breaking": "eq.true",
+                    "status": "eq.published",
+                    "order": "published_at.desc",
+                    "limit": limit
+                },
+                headers=self.headers
+            )
+
+            if response.status_code == 200:
+                articles = _loads(response.content)
+                await self.cache_set(cache_key, articles, ttl=READ_CACHE_TTL)
+                return articles
+            return []
 
         except Exception as e:
             logger.error(f"Error getting breaking news: {e}")
             return []
 
     async def get_stats(self) -> dict:
-        """Obtener estadísticas de Supabase"""
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Total de artículos
-                response = await client.get(
-                    f"{self.supabase_url}/rest/v1/noticias?select=count",
-                    headers={**self.headers, "Prefer": "count=exact"}
-                )
-
-                total = 0
-                if response.status_code == 200:
-                    content_range = response.headers.get("Content-Range", "")
-                    if "/" in content_range:
-                        total = int(content_range.split("/")[1])
-
-                # Por categoría
-                by_category = {}
-                categories = ["economia", "politica", "sociedad", "internacional", "judicial"]
-
-                for category_slug in categories:
-                    category_id = await self._get_category_id(category_slug)
-                    if category_id:
-                        response = await client.get(
-                            f"{self.supabase_url}/rest/v1/noticias?category_id=eq.{category_id}&select=count",
-                            headers={**self.headers, "Prefer": "count=exact"}
-                        )
-
-                        if response.status_code == 200:
-                            content_range = response.headers.get("Content-Range", "")
-                            if "/" in content_range:
-                                count = int(content_range.split("/")[1])
-                                by_category[category_slug] = count
+        """
+        Obtener estadísticas de Supabase
 
+        Usa la función noticias_stats() (migración 20251117000001) para contar
+        por categoría en una sola consulta agrupada; si la función no existe,
+        recurre a un COUNT por categoría.
+        """
+        try:
+            response = await self._request(
+                "POST",
+                _URL_STATS_RPC,
+                idempotent=True,  # Solo lectura
+                headers=self.headers,
+                content=b"{}"
+            )
+
+            if response.status_code == 200:
+                by_category = {row["slug"]: row["count"] for row in _loads(response.content)}
                 return {
-                    "total_articles": total,
+                    "total_articles": sum(by_category.values()),
                     "by_category": by_category
                 }
 
+            logger.debug(f"noticias_stats RPC unavailable ({response.status_code}), counting per category")
+            return await self._get_stats_by_count()
+
         except Exception as e:
             logger.error(f"Error getting stats: {e}")
             return {"total_articles": 0, "by_category": {}}
 
+    async def _get_stats_by_count(self) -> dict:
+        """Estadísticas con un COUNT por categoría (sin la función RPC)"""
+        # Total de artículos
+        response = await self._request(
+            "HEAD",
+            _URL_NOTICIAS,
+            params={"select": "id"},
+            headers=self._h_count
+        )
+        total = _content_range_total(response)
+
+        # Por categoría
+        by_category = {}
+        categories = ["economia", "politica", "sociedad", "internacional", "judicial"]
+
+        for category_slug in categories:
+            category_id = await self._get_category_id(category_slug)
+            if category_id:
+                response = await self._request(
+                    "HEAD",
+                    _URL_NOTICIAS,
+                    params={"category_id": f"eq.{category_id}", "select": "id"},
+                    headers=self._h_count
+                )
+                if response.status_code in [200, 206]:
+                    by_category[category_slug] = _content_range_total(response)
+
+        return {
+            "total_articles": total,
+            "by_category": by_category
+        }
+
     async def cleanup_old_articles(self, days: int = 90) -> int:
         """Eliminar artículos más antiguos que X días"""
         try:
             cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.delete(
-                    f"{self.supabase_url}/rest/v1/noticias?published_at=lt.{cutoff_date}",
-                    headers=self.headers
-                )
-
-                if response.status_code == 204:
-                    logger.info(f"Cleaned up articles older than {days} days")
-                    return 0  # Supabase no devuelve count en delete
-                return 0
+            # count=exact: PostgREST informa las filas borradas en Content-Range
+            response = await self._request(
+                "DELETE",
+                _URL_NOTICIAS,
+                params={"published_at": f"lt.{cutoff_date}"},
+                headers=self._h_count
+            )
+
+            if response.status_code in [200, 204]:
+                deleted = _content_range_total(response)
+                self._mem_cache.clear()
+                logger.info(f"Cleaned up {deleted} articles older than {days} days")
+                return deleted
+            return 0
 
         except Exception as e:
             logger.error(f"Error cleaning up: {e}")
@@ -386,51 +798,49 @@ class SupabaseStorage:
             # Calcular fecha límite (ahora - X días)
             cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Primero obtener los IDs de artículos a eliminar
-                response = await client.get(
-                    f"{self.supabase_url}/rest/v1/noticias?source_type=eq.0&published_at=gte.{cutoff_date}&select=id",
-                    headers=self.headers
-                )
+            # Eliminar por source_type=0 y fecha >= cutoff; el count viene en Content-Range
+            response = await self._request(
+                "DELETE",
+                _URL_NOTICIAS,
+                params={"source_type": "eq.0", "published_at": f"gte.{cutoff_date}"},
+                headers=self._h_count
+            )
+
+            if response.status_code in [200, 204]:
+                count = _content_range_total(response)
+                if not count:
+                    logger.info(f"No scraped articles from last {days} days to delete")
+                    return 0
 
-                if response.status_code == 200:
-                    articles = response.json()
-                    if not articles:
-                        logger.info(f"No scraped articles from last {days} days to delete")
-                        return 0
-
-                    # Eliminar por source_type=0 y fecha >= cutoff
-                    delete_response = await client.delete(
-                        f"{self.supabase_url}/rest/v1/noticias?source_type=eq.0&published_at=gte.{cutoff_date}",
-                        headers=self.headers
-                    )
-
-                    if delete_response.status_code == 204:
-                        count = len(articles)
-                        logger.info(f"Deleted {count} scraped articles from last {days} days")
-                        return count
+                self._mem_cache.clear()
+                logger.info(f"Deleted {count} scraped articles from last {days} days")
+                return count
 
-                return 0
+            return 0
 
         except Exception as e:
             logger.error(f"Error deleting recent scraped articles: {e}")
             return 0
 
-    # Métodos de cache usando Supabase (opcional, para compatibilidad)
+    # Cache en memoria del proceso con TTL (reemplaza a Redis)
     async def cache_get(self, key: str) -> Optional[Any]:
-        """Obtener del cache (usando tabla temporal en Supabase o simplemente retornar None)"""
-        # Para simplificar, no implementamos cache en Supabase
-        # El cache se puede manejar en memoria si es necesario
-        return None
+        """Obtener del cache; None si no existe o expiró"""
+        entry = self._mem_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._mem_cache[key]
+            return None
+        return entry[1]
 
     async def cache_set(self, key: str, value: Any, ttl: int = 3600) -> bool:
-        """Guardar en cache"""
-        # No implementado - usar cache en memoria si es necesario
+        """Guardar en cache por ttl segundos"""
+        self._mem_cache[key] = (time.monotonic() + ttl, value)
         return True
 
     async def cache_delete(self, key: str) -> bool:
         """Eliminar del cache"""
-        return True
+        return self._mem_cache.pop(key, None) is not None
 
     async def upload_image(
         self,
@@ -465,33 +875,37 @@ class SupabaseStorage:
             if not remote_path:
                 remote_path = f"{full_path.parent.name}/{full_path.name}"
 
-            # Read image file
-            async with aiofiles.open(full_path, 'rb') as f:
-                image_data = await f.read()
+            # Stream the file in chunks instead of loading it whole into memory
+            async def _chunks():
+                async with aiofiles.open(full_path, 'rb') as f:
+                    while chunk := await f.read(UPLOAD_CHUNK_SIZE):
+                        yield chunk
 
-            # Upload to Supabase Storage
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                upload_url = f"{self.supabase_url}/storage/v1/object/{self.storage_bucket}/{remote_path}"
-
-                response = await client.post(
-                    upload_url,
-                    headers={
-                        "apikey": self.supabase_key,
-                        "Authorization": f"Bearer {self.supabase_key}",
-                        "Content-Type": "image/jpeg",
-                        "x-upsert": "true"  # Overwrite if exists
-                    },
-                    content=image_data
-                )
+            content_type = mimetypes.guess_type(full_path.name)[0] or "image/jpeg"
 
-                if response.status_code in [200, 201]:
-                    # Return public URL
-                    public_url = f"{self.supabase_url}/storage/v1/object/public/{self.storage_bucket}/{remote_path}"
-                    logger.info(f"Uploaded image to Supabase: {remote_path}")
-                    return public_url
-                else:
-                    logger.error(f"Failed to upload image: {response.status_code} - {response.text}")
-                    return None
+            # Upload to Supabase Storage
+            upload_url = f"/storage/v1/object/{self.storage_bucket}/{remote_path}"
+
+            response = await self.client.post(
+                upload_url,
+                headers={
+                    "apikey": self.supabase_key,
+                    "Authorization": f"Bearer {self.supabase_key}",
+                    "Content-Type": content_type,
+                    "Content-Length": str(full_path.stat().st_size),
+                    "x-upsert": "true"  # Overwrite if exists
+                },
+                content=_chunks()
+            )
+
+            if response.status_code in [200, 201]:
+                # Return public URL
+                public_url = f"{self.supabase_url}/storage/v1/object/public/{self.storage_bucket}/{remote_path}"
+                logger.info(f"Uploaded image to Supabase: {remote_path}")
+                return public_url
+            else:
+                logger.error(f"Failed to upload image: {response.status_code} - {response.text}")
+                return None
 
         except Exception as e:
             logger.error(f"Error uploading image to Supabase: {e}")
@@ -500,35 +914,27 @@ class SupabaseStorage:
     async def delete_all_articles(self) -> int:
         """Delete all articles from Supabase"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # First get all article IDs
-                response = await client.get(
-                    f"{self.supabase_url}/rest/v1/noticias?select=id",
-                    headers={**self.headers, "Prefer": "count=exact"}
-                )
-
-                if response.status_code == 200:
-                    articles = response.json()
-                    if not articles:
-                        logger.info("No articles to delete")
-                        return 0
-
-                    # Delete in batches
-                    deleted = 0
-                    for article in articles:
-                        delete_response = await client.delete(
-                            f"{self.supabase_url}/rest/v1/noticias?id=eq.{article['id']}",
-                            headers=self.headers
-                        )
-                        if delete_response.status_code == 204:
-                            deleted += 1
-
-                    logger.info(f"Deleted {deleted} articles from Supabase")
-                    return deleted
-                else:
-                    logger.error(f"Failed to get articles: {response.status_code} - {response.text}")
+            # Single bulk DELETE; PostgREST reports the row count in Content-Range
+            response = await self._request(
+                "DELETE",
+                _URL_NOTICIAS,
+                params={"id": "not.is.null"},
+                headers=self._h_count
+            )
+
+            if response.status_code in [200, 204]:
+                deleted = _content_range_total(response)
+                if not deleted:
+                    logger.info("No articles to delete")
                     return 0
 
+                self._mem_cache.clear()
+                logger.info(f"Deleted {deleted} articles from Supabase")
+                return deleted
+
+            logger.error(f"Failed to delete articles: {response.status_code} - {response.text}")
+            return 0
+
         except Exception as e:
             logger.error(f"Error deleting all articles: {e}")
             return 0
@@ -4,7 +4,7 @@ Utils package - Full featured with enhanced stealth and CV-based image quality
 from .logger import setup_logger, get_logger
 from .image_handler import ImageHandler
 from .stealth_config import StealthConfig, RateLimiter, StealthBrowser
-from .advanced_stealth import get_advanced_stealth_script
+from .advanced_stealth import get_advanced_stealth_script, get_advanced_stealth_script_bytes
 from .image_quality_assessor import ImageQualityAssessor
 
 __all__ = [
@@ -15,5 +15,6 @@ __all__ = [
     'RateLimiter',
     'StealthBrowser',
     'get_advanced_stealth_script',
+    'get_advanced_stealth_script_bytes',
     'ImageQualityAssessor',
 ]
@@ -1,14 +1,14 @@
 """
 Advanced stealth scripts for fingerprinting evasion
 """
-ADVANCED_STEALTH_SCRIPT = """
-// ============================================
-// ADVANCED ANTI-DETECTION SCRIPT
-// ============================================
+import re
+from typing import Literal
 
-(function() {
-    'use strict';
-    
+StealthLevel = Literal["slim", "full"]
+
+# Parches agrupados por costo: los "pesados" envuelven APIs que las páginas llaman en caliente
+# (canvas, audio) y solo se incluyen en el nivel "full"
+_CORE_PATCHES = """
     // 1. Hide webdriver property completely
     Object.defineProperty(navigator, 'webdriver', {
         get: () => undefined,
@@ -55,25 +55,6 @@ ADVANCED_STEALTH_SCRIPT = """
             : originalQuery(parameters);
     };
     
-    // 6. Canvas Fingerprinting Evasion
-    const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
-    HTMLCanvasElement.prototype.toDataURL = function(type) {
-        if (type === 'image/png' || type === 'image/jpeg') {
-            const context = this.getContext('2d');
-            if (context) {
-                const imageData = context.getImageData(0, 0, this.width, this.height);
-                // Add minimal noise to canvas (undetectable to human eye)
-                for (let i = 0; i < imageData.data.length; i += 4) {
-                    if (Math.random() < 0.001) { // 0.1% of pixels
-                        imageData.data[i] += Math.random() < 0.5 ? -1 : 1;
-                    }
-                }
-                context.putImageData(imageData, 0, 0);
-            }
-        }
-        return originalToDataURL.apply(this, arguments);
-    };
-    
     // 7. WebGL Fingerprinting Evasion
     const getParameter = WebGLRenderingContext.prototype.getParameter;
     WebGLRenderingContext.prototype.getParameter = function(parameter) {
@@ -86,26 +67,6 @@ ADVANCED_STEALTH_SCRIPT = """
         return getParameter.apply(this, arguments);
     };
     
-    // 8. Audio Context Fingerprinting Evasion
-    const AudioContext = window.AudioContext || window.webkitAudioContext;
-    if (AudioContext) {
-        const originalCreateAnalyser = AudioContext.prototype.createAnalyser;
-        AudioContext.prototype.createAnalyser = function() {
-            const analyser = originalCreateAnalyser.apply(this, arguments);
-            const originalGetFloatFrequencyData = analyser.getFloatFrequencyData;
-            analyser.getFloatFrequencyData = function(array) {
-                originalGetFloatFrequencyData.apply(this, arguments);
-                // Add minimal noise to audio fingerprint
-                for (let i = 0; i < array.length; i++) {
-                    if (Math.random() < 0.01) {
-                        array[i] += (Math.random() - 0.5) * 0.0001;
-                    }
-                }
-            };
-            return analyser;
-        };
-    }
-    
     // 9. Battery API evasion (if available)
     if (navigator.getBattery) {
         const originalGetBattery = navigator.getBattery;
@@ -203,28 +164,6 @@ ADVANCED_STEALTH_SCRIPT = """
         configurable: true
     });
     
-    // 19. Override fetch to add realistic headers
-    const originalFetch = window.fetch;
-    window.fetch = function(...args) {
-        const [url, options = {}] = args;
-        const headers = new Headers(options.headers || {});
-        
-        // Ensure realistic headers
-        if (!headers.has('Accept-Language')) {
-            headers.set('Accept-Language', 'es-ES,es;q=0.9,en;q=0.8');
-        }
-        
-        options.headers = headers;
-        return originalFetch.apply(this, [url, options]);
-    };
-    
-    // 20. Override XMLHttpRequest for consistency
-    const originalXHROpen = XMLHttpRequest.prototype.open;
-    XMLHttpRequest.prototype.open = function(method, url, ...rest) {
-        this._url = url;
-        return originalXHROpen.apply(this, [method, url, ...rest]);
-    };
-    
     // 21. Add realistic mouse event properties
     const originalMouseEvent = MouseEvent;
     window.MouseEvent = function(type, init) {
@@ -234,18 +173,6 @@ ADVANCED_STEALTH_SCRIPT = """
         return new originalMouseEvent(type, init);
     };
     
-    // 22. Override getBoundingClientRect to prevent detection
-    const originalGetBoundingClientRect = Element.prototype.getBoundingClientRect;
-    Element.prototype.getBoundingClientRect = function() {
-        const rect = originalGetBoundingClientRect.apply(this, arguments);
-        // Add tiny random offset (undetectable)
-        return {
-            ...rect,
-            x: rect.x + (Math.random() - 0.5) * 0.001,
-            y: rect.y + (Math.random() - 0.5) * 0.001
-        };
-    };
-    
     // 23. Prevent detection via iframe
     Object.defineProperty(window, 'frames', {
         get: () => window,
@@ -309,16 +236,116 @@ ADVANCED_STEALTH_SCRIPT = """
             });
         };
     }
+"""
+
+_HEAVY_PATCHES = """
+    // 6. Canvas Fingerprinting Evasion
+    // Deterministic per-origin noise (same canvas -> same hash), applied once per canvas
+    const canvasNoised = new WeakMap();
+    const canvasSeed = (() => {
+        let hash = 2166136261; // FNV-1a over the hostname
+        for (let i = 0; i < location.hostname.length; i++) {
+            hash = Math.imul(hash ^ location.hostname.charCodeAt(i), 16777619);
+        }
+        return hash >>> 0;
+    })();
+    const mulberry32 = (seed) => () => {
+        seed = (seed + 0x6D2B79F5) | 0;
+        let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+        t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+        return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+    };
+    const CANVAS_NOISE_PIXELS = 16;
+    const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
+    HTMLCanvasElement.prototype.toDataURL = function(type) {
+        if ((type === 'image/png' || type === 'image/jpeg') && !canvasNoised.has(this)) {
+            canvasNoised.set(this, true);
+            const context = this.getContext('2d');
+            if (context && this.width && this.height) {
+                // Nudge a fixed number of pixels (undetectable to human eye), one at a time
+                const random = mulberry32(canvasSeed);
+                for (let n = 0; n < CANVAS_NOISE_PIXELS; n++) {
+                    const x = Math.floor(random() * this.width);
+                    const y = Math.floor(random() * this.height);
+                    const pixel = context.getImageData(x, y, 1, 1);
+                    pixel.data[0] += random() < 0.5 ? -1 : 1;
+                    context.putImageData(pixel, x, y);
+                }
+            }
+        }
+        return originalToDataURL.apply(this, arguments);
+    };
     
-    // 30. Final touch - ensure all overrides are persistent
-    Object.freeze(navigator);
-    Object.freeze(window.chrome || {});
-    
-})();
+    // 8. Audio Context Fingerprinting Evasion
+    const AudioContext = window.AudioContext || window.webkitAudioContext;
+    if (AudioContext) {
+        const originalCreateAnalyser = AudioContext.prototype.createAnalyser;
+        AudioContext.prototype.createAnalyser = function() {
+            const analyser = originalCreateAnalyser.apply(this, arguments);
+            const originalGetFloatFrequencyData = analyser.getFloatFrequencyData;
+            analyser.getFloatFrequencyData = function(array) {
+                originalGetFloatFrequencyData.apply(this, arguments);
+                // Add minimal noise to audio fingerprint
+                for (let i = 0; i < array.length; i++) {
+                    if (Math.random() < 0.01) {
+                        array[i] += (Math.random() - 0.5) * 0.0001;
+                    }
+                }
+            };
+            return analyser;
+        };
+    }
 """
 
-def get_advanced_stealth_script() -> str:
-    """Get the advanced anti-detection script"""
-    return ADVANCED_STEALTH_SCRIPT
+def _wrap_patches(*patches: str) -> str:
+    """Wrap stealth patches in a strict-mode IIFE"""
+    return (
+        "\n// ============================================\n"
+        "// ADVANCED ANTI-DETECTION SCRIPT\n"
+        "// ============================================\n\n"
+        "(function() {\n    'use strict';\n"
+        + "".join(patches)
+        + "\n})();\n"
+    )
+
+
+# Slim: webdriver, chrome, languages, plugins, webgl... sin wrappers sobre APIs calientes
+STEALTH_MINIMAL = _wrap_patches(_CORE_PATCHES)
+STEALTH_FULL = _wrap_patches(_CORE_PATCHES, _HEAVY_PATCHES)
+ADVANCED_STEALTH_SCRIPT = STEALTH_FULL
+
+
+def _minify_script(script: str) -> str:
+    """Strip comments and collapse whitespace (the script relies on explicit semicolons)"""
+    # Line comments only when preceded by whitespace, so '//' inside URLs/strings survives
+    script = re.sub(r"(^|\s)//[^\n]*", r"\1", script, flags=re.MULTILINE)
+    script = re.sub(r"/\*.*?\*/", "", script, flags=re.DOTALL)
+    return re.sub(r"\s+", " ", script).strip()
+
+
+# Minificado una sola vez al importar: menos bytes por CDP y menos parseo en V8 por página
+_MINIFIED_SCRIPTS = {
+    "slim": _minify_script(STEALTH_MINIMAL),
+    "full": _minify_script(STEALTH_FULL),
+}
+_MINIFIED_SCRIPTS_BYTES = {level: script.encode("utf-8") for level, script in _MINIFIED_SCRIPTS.items()}
+
+
+def get_advanced_stealth_script(level: StealthLevel = "slim") -> str:
+    """
+    Get the advanced anti-detection script (minified)
+
+    Args:
+        level: "slim" omits the patches that wrap hot page APIs (canvas,
+            audio); "full" includes every patch
+
+    Returns:
+        Minified JavaScript source
+    """
+    return _MINIFIED_SCRIPTS[level]
+
 
+def get_advanced_stealth_script_bytes(level: StealthLevel = "slim") -> bytes:
+    """Get the minified anti-detection script as UTF-8 bytes, for callers that feed CDP directly"""
+    return _MINIFIED_SCRIPTS_BYTES[level]
 
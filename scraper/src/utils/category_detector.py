@@ -3,212 +3,511 @@ Category detection utility
 Detects article category from URL, content, and metadata
 """
 import re
-from typing import Optional
+import unicodedata
+from bisect import bisect_right
+from collections import Counter
+from functools import lru_cache
+from itertools import combinations
+from typing import List, Optional, Tuple, Union
 from bs4 import BeautifulSoup
 from loguru import logger
 
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
 
-class CategoryDetector:
-    """Detect article category automatically"""
-
-    # Palabras clave que indican contenido relacionado con Argentina
-    ARGENTINA_KEYWORDS = [
-        "argentina", "argentino", "argentinos", "argentinas", "buenos aires",
-        "caba", "rosario", "córdoba", "cordoba", "mendoza", "la plata",
-        "milei", "cristina", "kirchner", "macri", "bullrich", "massa",
-        "afa", "selección argentina", "river", "boca", "racing", "independiente",
-        "casa rosada", "congreso nacional", "bcra", "ypf", "aerolineas argentinas",
-        "patagonia", "pampa", "litoral", "cuyo", "noa", "nea"
-    ]
-
-    # Mapeo de palabras clave a categorías
-    CATEGORY_KEYWORDS = {
-        "economia": [
-            "economía", "economia", "dólar", "dolar", "peso", "inflación", "inflacion",
-            "bcra", "banco central", "mercado", "finanzas", "empresas", "negocios",
-            "exportación", "exportacion", "importación", "importacion", "comercio",
-            "trabajo", "empleo", "salario", "precio", "costo", "tarifa", "impuesto"
-        ],
-        "politica": [
-            "política", "politica", "gobierno", "presidente", "ministro", "congreso",
-            "diputado", "senador", "elección", "eleccion", "votación", "votacion",
-            "partido", "candidato", "campaña", "campana", "ley", "proyecto", "decreto",
-            "militar", "fuerza", "seguridad", "defensa", "poder", "estado"
-        ],
-        "judicial": [
-            "judicial", "juez", "tribunal", "corte", "fiscal", "abogado", "juicio",
-            "sentencia", "causa", "proceso", "delito", "crimen", "criminal", "penal",
-            "prisión", "prision", "cárcel", "carcel", "detención", "detencion",
-            "acusación", "acusacion", "imputado", "víctima", "victima"
-        ],
-        "internacional": [
-            "internacional", "mundo", "global", "país", "pais", "nación", "nacion",
-            "extranjero", "exterior", "diplomacia", "embajada", "consulado",
-            "organización", "organizacion", "onu", "naciones unidas", "ue", "europa",
-            "eeuu", "estados unidos", "china", "brasil", "chile", "uruguay"
-        ],
-        "sociedad": [
-            "sociedad", "social", "comunidad", "población", "poblacion", "ciudadano",
-            "ciudadana", "derecho", "derechos", "salud", "educación", "educacion",
-            "cultura", "arte", "música", "musica", "deporte", "deportes", "tecnología",
-            "tecnologia", "ciencia", "medio ambiente", "medioambiente", "clima",
-            "transporte", "tránsito", "transito", "vial", "accidente"
-        ]
-    }
-    
-    # Mapeo de URLs a categorías
-    URL_PATTERNS = {
-        "economia": [
-            r"/economia", r"/economy", r"/finanzas", r"/finances", r"/negocios",
-            r"/mercado", r"/dolar", r"/dólar"
-        ],
-        "politica": [
-            r"/politica", r"/politics", r"/gobierno", r"/government", r"/congreso",
-            r"/elecciones", r"/elections"
-        ],
-        "judicial": [
-            r"/judicial", r"/justicia", r"/justice", r"/corte", r"/tribunal",
-            r"/juicio", r"/trial"
-        ],
-        "internacional": [
-            r"/internacional", r"/internacionales", r"/mundo", r"/world",
-            r"/america", r"/américa", r"/exterior"
-        ],
-        "sociedad": [
-            r"/sociedad", r"/society", r"/salud", r"/health", r"/educacion",
-            r"/educación", r"/cultura", r"/deportes", r"/deportes"
-        ]
-    }
-    
-    @classmethod
-    def detect_from_url(cls, url: str) -> Optional[str]:
-        """Detect category from URL"""
-        url_lower = url.lower()
-        
-        for category, patterns in cls.URL_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, url_lower):
-                    logger.debug(f"Category detected from URL: {category}")
-                    return category
-        
-        return None
-    
-    @classmethod
-    def detect_from_content(cls, title: str, content: str, excerpt: str = "") -> Optional[str]:
-        """Detect category from article content"""
-        text = f"{title} {excerpt} {content}".lower()
-        
-        # Contar coincidencias por categoría
-        category_scores = {}
-        
-        for category, keywords in cls.CATEGORY_KEYWORDS.items():
-            score = 0
-            for keyword in keywords:
-                # Buscar palabra completa (no como parte de otra palabra)
-                pattern = r'\b' + re.escape(keyword) + r'\b'
-                matches = len(re.findall(pattern, text, re.IGNORECASE))
-                score += matches
-            
-            if score > 0:
-                category_scores[category] = score
-        
-        if category_scores:
-            # Retornar categoría con mayor score
-            detected = max(category_scores.items(), key=lambda x: x[1])
-            logger.debug(f"Category detected from content: {detected[0]} (score: {detected[1]})")
-            return detected[0]
-        
-        return None
-    
-    @classmethod
-    def detect_from_metadata(cls, soup: BeautifulSoup) -> Optional[str]:
-        """Detect category from HTML metadata"""
-        # Buscar en meta tags
-        meta_category = soup.find('meta', property='article:section') or \
-                       soup.find('meta', attrs={'name': 'category'}) or \
-                       soup.find('meta', attrs={'name': 'news_keywords'})
-        
-        if meta_category:
-            content = meta_category.get('content', '').lower()
-            for category in cls.CATEGORY_KEYWORDS.keys():
-                if category in content:
-                    logger.debug(f"Category detected from metadata: {category}")
-                    return category
-        
-        # Buscar en breadcrumbs o navigation
-        breadcrumbs = soup.find('nav', class_=re.compile('breadcrumb', re.I)) or \
-                     soup.find('ol', class_=re.compile('breadcrumb', re.I))
-        
-        if breadcrumbs:
-            breadcrumb_text = breadcrumbs.get_text().lower()
-            for category in cls.CATEGORY_KEYWORDS.keys():
-                if category in breadcrumb_text:
-                    logger.debug(f"Category detected from breadcrumbs: {category}")
-                    return category
-        
+try:
+    from selectolax.parser import HTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+# El paquete "regex" (motor en C con mejor manejo de alternaciones) reemplaza a "re" si está instalado
+try:
+    import regex as _regex_engine
+    HAS_REGEX = True
+except ImportError:
+    _regex_engine = re
+    HAS_REGEX = False
+
+
+# Variantes acentuadas de cada letra: las keywords se guardan sin acentos y el patrón
+# acepta ambas formas, así el texto no necesita una pasada extra de normalización
+_ACCENT_VARIANTS = {"a": "á", "e": "é", "i": "í", "o": "ó", "u": "úü", "n": "ñ"}
+# Máximo de letras acentuadas por keyword en el autómata (en español alcanza con tilde + ñ/ü)
+_MAX_ACCENTED_CHARS = 2
+
+
+def _strip_accents(text: str) -> str:
+    """Remove diacritics ("política" -> "politica", "campaña" -> "campana")"""
+    return "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+
+
+def _unaccented(keywords) -> set:
+    """Deduplicate keywords that only differ by accents ("economía"/"economia")"""
+    return {_strip_accents(keyword) for keyword in keywords}
+
+
+def _accent_pattern(keyword: str) -> str:
+    """Regex for an unaccented keyword that also matches its accented spellings"""
+    return "".join(
+        f"[{char}{_ACCENT_VARIANTS[char]}]" if char in _ACCENT_VARIANTS else re.escape(char)
+        for char in keyword
+    )
+
+
+def _accent_variants(keyword: str):
+    """Yield an unaccented keyword and its spellings with up to _MAX_ACCENTED_CHARS accents"""
+    positions = [i for i, char in enumerate(keyword) if char in _ACCENT_VARIANTS]
+    for count in range(_MAX_ACCENTED_CHARS + 1):
+        for chosen in combinations(positions, count):
+            variants = [""]
+            for i, char in enumerate(keyword):
+                options = _ACCENT_VARIANTS[char] if i in chosen else char
+                variants = [variant + option for variant in variants for option in options]
+            yield from variants
+
+
+def _keyword_alternation(keywords) -> str:
+    """Whole-word, accent-insensitive regex alternation for a list of keywords"""
+    # Longest first so multi-word keywords win over their prefixes
+    alternation = "|".join(_accent_pattern(k) for k in sorted(_unaccented(keywords), key=len, reverse=True))
+    return r"\b(?:" + alternation + r")\b"
+
+
+def _keyword_regex(keywords):
+    """Compile a list of keywords into one whole-word alternation (expects lowercased text)"""
+    return _regex_engine.compile(_keyword_alternation(keywords))
+
+
+def _category_regex(category_keywords: dict):
+    """Compile all categories into one alternation with a named group per category (expects lowercased text)"""
+    return _regex_engine.compile(
+        "|".join(
+            f"(?P<{category}>{_keyword_alternation(keywords)})"
+            for category, keywords in category_keywords.items()
+        )
+    )
+
+
+def _url_prefix_index(url_patterns: dict) -> dict:
+    """Map each literal URL segment prefix ("/economia" -> "economia") to its category"""
+    index = {}
+    for category, patterns in url_patterns.items():
+        for pattern in patterns:
+            index.setdefault(pattern.lstrip("/"), category)
+    return index
+
+
+def _keyword_automaton(keyword_values: dict):
+    """Build an Aho-Corasick automaton mapping each keyword (and its accented spellings) to (len, value)"""
+    automaton = ahocorasick.Automaton()
+    for keyword, value in keyword_values.items():
+        for variant in _accent_variants(keyword):
+            if variant not in automaton:
+                automaton.add_word(variant, (len(variant), value))
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_word_char(char: str) -> bool:
+    """Same notion of word character as the regex \\b boundary"""
+    return char.isalnum() or char == "_"
+
+
+def _automaton_match_ends(automaton, text: str):
+    """Yield (end index, value) for every whole-word keyword match in text (one linear pass)"""
+    last = len(text) - 1
+    for end, (length, value) in automaton.iter_long(text):
+        start = end - length + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end < last and _is_word_char(text[end + 1]):
+            continue
+        yield end, value
+
+
+def _automaton_matches(automaton, text: str):
+    """Yield the value of every whole-word keyword match in text (one linear pass)"""
+    for _, value in _automaton_match_ends(automaton, text):
+        yield value
+
+
+# Palabras clave que indican contenido relacionado con Argentina
+ARGENTINA_KEYWORDS = frozenset([
+    "argentina", "argentino", "argentinos", "argentinas", "buenos aires",
+    "caba", "rosario", "córdoba", "cordoba", "mendoza", "la plata",
+    "milei", "cristina", "kirchner", "macri", "bullrich", "massa",
+    "afa", "selección argentina", "river", "boca", "racing", "independiente",
+    "casa rosada", "congreso nacional", "bcra", "ypf", "aerolineas argentinas",
+    "patagonia", "pampa", "litoral", "cuyo", "noa", "nea"
+])
+
+# Prefiltro por substring antes del escaneo completo (ordenado por frecuencia de aparición)
+ARGENTINA_FAST_KEYWORDS = ("argentin", "buenos aires", "milei", "kirchner")
+
+# Caracteres del cuerpo que se escanean: las keywords que definen la categoría se concentran
+# en título, bajada y primeros párrafos
+CONTENT_SCAN_LIMIT = 2048
+
+# Mapeo de palabras clave a categorías
+CATEGORY_KEYWORDS = {
+    "economia": frozenset([
+        "economía", "economia", "dólar", "dolar", "peso", "inflación", "inflacion",
+        "bcra", "banco central", "mercado", "finanzas", "empresas", "negocios",
+        "exportación", "exportacion", "importación", "importacion", "comercio",
+        "trabajo", "empleo", "salario", "precio", "costo", "tarifa", "impuesto"
+    ]),
+    "politica": frozenset([
+        "política", "politica", "gobierno", "presidente", "ministro", "congreso",
+        "diputado", "senador", "elección", "eleccion", "votación", "votacion",
+        "partido", "candidato", "campaña", "campana", "ley", "proyecto", "decreto",
+        "militar", "fuerza", "seguridad", "defensa", "poder", "estado"
+    ]),
+    "judicial": frozenset([
+        "judicial", "juez", "tribunal", "corte", "fiscal", "abogado", "juicio",
+        "sentencia", "causa", "proceso", "delito", "crimen", "criminal", "penal",
+        "prisión", "prision", "cárcel", "carcel", "detención", "detencion",
+        "acusación", "acusacion", "imputado", "víctima", "victima"
+    ]),
+    "internacional": frozenset([
+        "internacional", "mundo", "global", "país", "pais", "nación", "nacion",
+        "extranjero", "exterior", "diplomacia", "embajada", "consulado",
+        "organización", "organizacion", "onu", "naciones unidas", "ue", "europa",
+        "eeuu", "estados unidos", "china", "brasil", "chile", "uruguay"
+    ]),
+    "sociedad": frozenset([
+        "sociedad", "social", "comunidad", "población", "poblacion", "ciudadano",
+        "ciudadana", "derecho", "derechos", "salud", "educación", "educacion",
+        "cultura", "arte", "música", "musica", "deporte", "deportes", "tecnología",
+        "tecnologia", "ciencia", "medio ambiente", "medioambiente", "clima",
+        "transporte", "tránsito", "transito", "vial", "accidente"
+    ])
+}
+
+# Mapeo de URLs a categorías
+URL_PATTERNS = {
+    "economia": frozenset([
+        "/economia", "/economy", "/finanzas", "/finances", "/negocios",
+        "/mercado", "/dolar", "/dólar"
+    ]),
+    "politica": frozenset([
+        "/politica", "/politics", "/gobierno", "/government", "/congreso",
+        "/elecciones", "/elections"
+    ]),
+    "judicial": frozenset([
+        "/judicial", "/justicia", "/justice", "/corte", "/tribunal",
+        "/juicio", "/trial"
+    ]),
+    "internacional": frozenset([
+        "/internacional", "/internacionales", "/mundo", "/world",
+        "/america", "/américa", "/exterior"
+    ]),
+    "sociedad": frozenset([
+        "/sociedad", "/society", "/salud", "/health", "/educacion",
+        "/educación", "/cultura", "/deportes"
+    ])
+}
+
+# Índice de prefijos de segmento de URL (sin regex): literal -> categoría, probado por longitud
+_URL_PREFIXES = _url_prefix_index(URL_PATTERNS)
+_URL_PREFIX_LENGTHS = tuple(sorted({len(prefix) for prefix in _URL_PREFIXES}))
+_URL_CATEGORY_RANK = {category: rank for rank, category in enumerate(URL_PATTERNS)}
+# Una sola pasada sobre el texto: match.lastgroup indica la categoría
+_CATEGORY_RX = _category_regex(CATEGORY_KEYWORDS)
+_ARGENTINA_RX = _keyword_regex(ARGENTINA_KEYWORDS)
+
+# Con pyahocorasick: autómatas en C, un escaneo lineal sin importar la cantidad de keywords
+if HAS_AHOCORASICK:
+    _CATEGORY_AUTOMATON = _keyword_automaton(
+        {keyword: category for category, keywords in CATEGORY_KEYWORDS.items() for keyword in _unaccented(keywords)}
+    )
+    _ARGENTINA_AUTOMATON = _keyword_automaton({keyword: keyword for keyword in _unaccented(ARGENTINA_KEYWORDS)})
+else:
+    _CATEGORY_AUTOMATON = _ARGENTINA_AUTOMATON = None
+
+
+# Funciones de módulo: los patrones precompilados se ligan como argumentos por defecto
+# (variables locales en el bytecode, sin lookup de atributos de clase por llamada)
+
+@lru_cache(maxsize=4096)
+def _segment_category(segment: str) -> Optional[str]:
+    """Best category whose URL prefix starts this (lowercased) path segment"""
+    detected = None
+    for length in _URL_PREFIX_LENGTHS:
+        if length > len(segment):
+            break
+        category = _URL_PREFIXES.get(segment[:length])
+        if category and (detected is None or _URL_CATEGORY_RANK[category] < _URL_CATEGORY_RANK[detected]):
+            detected = category
+    return detected
+
+
+def detect_from_url(
+    url: str,
+    _segment_category=_segment_category,
+    _rank=_URL_CATEGORY_RANK
+) -> Optional[str]:
+    """Detect category from URL"""
+    detected = None
+
+    # Un patrón "/x" coincide cuando algún segmento de la URL empieza con "x";
+    # ante varias coincidencias gana la categoría que aparece primero en URL_PATTERNS.
+    # Los segmentos de sección ("politica", "economia") se repiten en miles de URLs: cacheados
+    for segment in url.lower().split("/")[1:]:
+        category = _segment_category(segment)
+        if category and (detected is None or _rank[category] < _rank[detected]):
+            detected = category
+
+    if detected:
+        logger.debug(f"Category detected from URL: {detected}")
+    return detected
+
+
+def _text_lower(title: str, content: str, excerpt: str = "") -> str:
+    """Texto combinado en minúsculas que comparten los detectores de contenido"""
+    # str.lower ya tiene camino rápido en C para ASCII; str.translate con tabla es ~20x más lento
+    # y bytes.translate no pasa a minúsculas "Í"/"Ñ" ni respeta \b sobre letras acentuadas
+    if len(content) > CONTENT_SCAN_LIMIT:
+        # Cortar en el último espacio para no dejar una palabra truncada ("leyes" -> "ley")
+        content = content[:CONTENT_SCAN_LIMIT].rsplit(" ", 1)[0]
+    return f"{title} {excerpt} {content}".lower()
+
+
+def detect_from_content(
+    title: str,
+    content: str,
+    excerpt: str = "",
+    text_lower: Optional[str] = None,
+    _automaton=_CATEGORY_AUTOMATON,
+    _rx=_CATEGORY_RX
+) -> Optional[str]:
+    """
+    Detect category from article content
+
+    Args:
+        text_lower: Precomputed lowercased title/excerpt/content (see detect_category)
+    """
+    text = text_lower if text_lower is not None else _text_lower(title, content, excerpt)
+
+    # Contar coincidencias por categoría (palabras completas, un solo escaneo)
+    if _automaton is not None:
+        category_scores = Counter(_automaton_matches(_automaton, text))
+    else:
+        category_scores = Counter(match.lastgroup for match in _rx.finditer(text))
+
+    return _best_category(category_scores)
+
+
+def _best_category(category_scores: Counter) -> Optional[str]:
+    """Category with the highest keyword score (ties: CATEGORY_KEYWORDS order)"""
+    if not category_scores:
         return None
-    
-    @classmethod
-    def is_about_argentina(cls, title: str, content: str, excerpt: str = "") -> bool:
-        """
-        Detecta si el artículo está relacionado con Argentina
 
-        Returns:
-            True si el artículo menciona Argentina o términos relacionados
-        """
-        text = f"{title} {excerpt} {content}".lower()
+    detected = max(CATEGORY_KEYWORDS, key=lambda category: category_scores[category])
+    logger.debug(f"Category detected from content: {detected} (score: {category_scores[detected]})")
+    return detected
+
+
+# Separador entre artículos del lote: no es carácter de palabra, ninguna keyword puede cruzarlo
+_BATCH_SEPARATOR = "\x00"
+
+
+def detect_batch(
+    articles: List[Tuple[str, str, str]],
+    _automaton=_CATEGORY_AUTOMATON,
+    _rx=_CATEGORY_RX
+) -> List[Optional[str]]:
+    """
+    Detect the content category of many articles with a single keyword scan
+
+    Args:
+        articles: (title, excerpt, content) tuples
+
+    Returns:
+        detect_from_content result for each article, in order
+    """
+    texts = [_text_lower(title, content, excerpt) for title, excerpt, content in articles]
+
+    # Offset de inicio de cada artículo dentro del texto concatenado
+    offsets = []
+    position = 0
+    for text in texts:
+        offsets.append(position)
+        position += len(text) + len(_BATCH_SEPARATOR)
+
+    combined = _BATCH_SEPARATOR.join(texts)
+    scores = [Counter() for _ in texts]
+
+    if _automaton is not None:
+        for end, category in _automaton_match_ends(_automaton, combined):
+            scores[bisect_right(offsets, end) - 1][category] += 1
+    else:
+        for match in _rx.finditer(combined):
+            scores[bisect_right(offsets, match.start()) - 1][match.lastgroup] += 1
 
-        # Buscar referencias a Argentina
-        for keyword in cls.ARGENTINA_KEYWORDS:
-            pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-            if re.search(pattern, text, re.IGNORECASE):
-                logger.debug(f"Article is about Argentina (keyword: {keyword})")
-                return True
+    return [_best_category(category_scores) for category_scores in scores]
 
-        logger.debug("Article is NOT about Argentina - will be categorized as internacional")
-        return False
 
-    @classmethod
-    def detect_category(
-        cls,
-        url: str,
-        title: str,
-        content: str,
-        excerpt: str = "",
-        soup: Optional[BeautifulSoup] = None
-    ) -> str:
-        """
-        Detect category using multiple methods
+def _metadata_texts_selectolax(html: str):
+    """Meta category content and breadcrumb text via selectolax CSS queries (C parser)"""
+    tree = HTMLParser(html)
 
-        Returns:
-            Category slug (default: "politica")
-        """
-        # Prioridad: URL > Metadata > Content
-        category = cls.detect_from_url(url)
+    meta_category = tree.css_first('meta[property="article:section"]') or \
+                   tree.css_first('meta[name="category"]') or \
+                   tree.css_first('meta[name="news_keywords"]')
+    meta_content = (meta_category.attributes.get('content') or '') if meta_category else ''
 
-        if not category and soup:
-            category = cls.detect_from_metadata(soup)
+    breadcrumbs = tree.css_first('nav[class*="breadcrumb" i]') or \
+                 tree.css_first('ol[class*="breadcrumb" i]')
+    breadcrumb_text = breadcrumbs.text() if breadcrumbs else ''
 
-        if not category:
-            category = cls.detect_from_content(title, content, excerpt)
+    return meta_content, breadcrumb_text
 
-        # Si no se detectó categoría, default a "politica"
-        if not category:
-            category = "politica"
 
-        # Si el artículo NO es sobre Argentina y no es ya "internacional",
-        # forzar categoría "internacional"
-        if category != "internacional" and not cls.is_about_argentina(title, content, excerpt):
-            logger.info(f"Article reclassified from '{category}' to 'internacional' (not about Argentina)")
-            category = "internacional"
+def _metadata_texts_soup(soup: BeautifulSoup):
+    """Meta category content and breadcrumb text via BeautifulSoup"""
+    meta_category = soup.find('meta', property='article:section') or \
+                   soup.find('meta', attrs={'name': 'category'}) or \
+                   soup.find('meta', attrs={'name': 'news_keywords'})
+    meta_content = meta_category.get('content', '') if meta_category else ''
 
-        return category
+    breadcrumbs = soup.find('nav', class_=re.compile('breadcrumb', re.I)) or \
+                 soup.find('ol', class_=re.compile('breadcrumb', re.I))
+    breadcrumb_text = breadcrumbs.get_text() if breadcrumbs else ''
 
+    return meta_content, breadcrumb_text
 
 
+def detect_from_metadata(soup: Union[BeautifulSoup, str]) -> Optional[str]:
+    """
+    Detect category from HTML metadata
 
+    Args:
+        soup: Parsed BeautifulSoup, or raw HTML (queried with selectolax when installed)
+    """
+    if isinstance(soup, str):
+        if HAS_SELECTOLAX:
+            meta_content, breadcrumb_text = _metadata_texts_selectolax(soup)
+        else:
+            meta_content, breadcrumb_text = _metadata_texts_soup(BeautifulSoup(soup, 'html.parser'))
+    else:
+        meta_content, breadcrumb_text = _metadata_texts_soup(soup)
 
+    # Buscar en meta tags
+    if meta_content:
+        content = meta_content.lower()
+        for category in CATEGORY_KEYWORDS.keys():
+            if category in content:
+                logger.debug(f"Category detected from metadata: {category}")
+                return category
 
+    # Buscar en breadcrumbs o navigation
+    if breadcrumb_text:
+        breadcrumb_text = breadcrumb_text.lower()
+        for category in CATEGORY_KEYWORDS.keys():
+            if category in breadcrumb_text:
+                logger.debug(f"Category detected from breadcrumbs: {category}")
+                return category
 
+    return None
+
+
+def is_about_argentina(
+    title: str,
+    content: str,
+    excerpt: str = "",
+    text_lower: Optional[str] = None,
+    _fast_keywords=ARGENTINA_FAST_KEYWORDS,
+    _automaton=_ARGENTINA_AUTOMATON,
+    _rx=_ARGENTINA_RX
+) -> bool:
+    """
+    Detecta si el artículo está relacionado con Argentina
+
+    Args:
+        text_lower: Texto ya combinado y en minúsculas (ver detect_category)
+
+    Returns:
+        True si el artículo menciona Argentina o términos relacionados
+    """
+    text = text_lower if text_lower is not None else _text_lower(title, content, excerpt)
+
+    # Camino rápido: la gran mayoría de los positivos menciona alguno de estos términos
+    for keyword in _fast_keywords:
+        if keyword in text:
+            logger.debug(f"Article is about Argentina (keyword: {keyword})")
+            return True
+
+    # Buscar referencias a Argentina
+    if _automaton is not None:
+        keyword = next(_automaton_matches(_automaton, text), None)
+    else:
+        match = _rx.search(text)
+        keyword = match.group(0) if match else None
+
+    if keyword:
+        logger.debug(f"Article is about Argentina (keyword: {keyword})")
+        return True
+
+    logger.debug("Article is NOT about Argentina - will be categorized as internacional")
+    return False
+
+
+def detect_category(
+    url: str,
+    title: str,
+    content: str,
+    excerpt: str = "",
+    soup: Optional[Union[BeautifulSoup, str]] = None
+) -> str:
+    """
+    Detect category using multiple methods
+
+    Args:
+        soup: Parsed page or raw HTML, used for metadata detection
+
+    Returns:
+        Category slug (default: "politica")
+    """
+    # Minúsculas una sola vez para contenido y chequeo de Argentina
+    text_lower = _text_lower(title, content, excerpt)
+
+    # Prioridad: URL > Metadata > Content
+    category = detect_from_url(url)
+
+    if not category and soup:
+        category = detect_from_metadata(soup)
+
+    if not category:
+        category = detect_from_content(title, content, excerpt, text_lower=text_lower)
+
+    # Si no se detectó categoría, default a "politica"
+    if not category:
+        category = "politica"
+
+    # Si el artículo NO es sobre Argentina y no es ya "internacional",
+    # forzar categoría "internacional"
+    if category != "internacional" and not is_about_argentina(title, content, excerpt, text_lower=text_lower):
+        logger.info(f"Article reclassified from '{category}' to 'internacional' (not about Argentina)")
+        category = "internacional"
+
+    return category
+
+
+class CategoryDetector:
+    """Detect article category automatically (compatibility shim over the module functions)"""
 
+    ARGENTINA_KEYWORDS = ARGENTINA_KEYWORDS
+    ARGENTINA_FAST_KEYWORDS = ARGENTINA_FAST_KEYWORDS
+    CATEGORY_KEYWORDS = CATEGORY_KEYWORDS
+    URL_PATTERNS = URL_PATTERNS
 
+    detect_from_url = staticmethod(detect_from_url)
+    detect_from_content = staticmethod(detect_from_content)
+    detect_batch = staticmethod(detect_batch)
+    detect_from_metadata = staticmethod(detect_from_metadata)
+    is_about_argentina = staticmethod(is_about_argentina)
+    detect_category = staticmethod(detect_category)
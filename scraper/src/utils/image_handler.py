@@ -3,16 +3,420 @@ Image download and processing utilities with Computer Vision quality validation
 """
 import asyncio
 import hashlib
+import io
+import multiprocessing
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 from urllib.parse import urlparse
-import aiofiles
+import cv2
 import httpx
-from PIL import Image
+import numpy as np
+from PIL import Image, features
 from loguru import logger
 
 from .image_quality_assessor import ImageQualityAssessor
 
+# Resize LANCZOS y encode JPEG son el costo de CPU dominante: con Pillow-SIMD compilado
+# contra libjpeg-turbo ambos usan rutas SIMD sin cambios de código
+try:
+    HAS_LIBJPEG_TURBO = bool(features.check_feature("libjpeg_turbo"))
+except ValueError:
+    HAS_LIBJPEG_TURBO = False
+
+# PyTurboJPEG (opcional): decode/encode JPEG en memoria directo con libjpeg-turbo
+try:
+    from turbojpeg import TurboJPEG, TJFLAG_PROGRESSIVE, TJPF_BGR, TJSAMP_420
+    _turbo_jpeg = TurboJPEG()
+    HAS_TURBOJPEG = True
+except (ImportError, OSError, RuntimeError):
+    _turbo_jpeg = None
+    HAS_TURBOJPEG = False
+
+try:
+    import h2  # noqa: F401  (httpx[http2])
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+# nvJPEG (opcional, vía torchvision): se importa solo si se pide backend='nvjpeg',
+# torch tarda segundos en cargar y la mayoría de los hosts no tiene GPU
+_nvjpeg_modules = None
+
+
+def _load_nvjpeg() -> bool:
+    """Import torch/torchvision lazily; True if a CUDA device is usable for nvJPEG"""
+    global _nvjpeg_modules
+    if _nvjpeg_modules is None:
+        try:
+            import torch
+            import torch.nn.functional as torch_functional
+            from torchvision.io import ImageReadMode, decode_jpeg, encode_jpeg
+            _nvjpeg_modules = (torch, torch_functional, ImageReadMode, decode_jpeg, encode_jpeg)
+        except ImportError:
+            _nvjpeg_modules = ()
+    return bool(_nvjpeg_modules) and _nvjpeg_modules[0].cuda.is_available()
+
+
+JPEG_MAGIC = b'\xff\xd8'
+UPLOAD_CHUNK_SIZE = 64 * 1024
+# Tamaño asumido cuando la respuesta no trae Content-Length (chunked)
+UNKNOWN_CONTENT_LENGTH = 4 * 1024 * 1024
+# Marcadores SOF (Start Of Frame) con las dimensiones de la imagen
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# Escalas de decode que libjpeg resuelve en el dominio DCT (sin IDCT a resolución completa)
+_JPEG_SCALE_DENOMINATORS = (8, 4, 2)
+_CV2_REDUCED_FLAGS = {
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+}
+# JPEG progresivo con croma 4:2:0: ~20-35% menos bytes a igual calidad visual en fotos
+_CV2_JPEG_PARAMS = [cv2.IMWRITE_JPEG_OPTIMIZE, 1, cv2.IMWRITE_JPEG_PROGRESSIVE, 1]
+if hasattr(cv2, 'IMWRITE_JPEG_SAMPLING_FACTOR'):
+    _CV2_JPEG_PARAMS += [cv2.IMWRITE_JPEG_SAMPLING_FACTOR, cv2.IMWRITE_JPEG_SAMPLING_FACTOR_420]
+
+
+# Procesamiento CPU-bound a nivel de módulo (picklable) para correr en un ProcessPoolExecutor
+
+def _init_worker() -> None:
+    """Pool worker setup: one process per core already, so assess sequentially inside it"""
+    ImageQualityAssessor.ASSESS_THREADS = 1
+
+
+def _jpeg_header(data: bytes) -> Optional[Tuple[int, int, int]]:
+    """Read (width, height, components) from the JPEG SOF marker without decoding"""
+    if data[:2] != JPEG_MAGIC:
+        return None
+
+    i = 2
+    while i + 9 < len(data):
+        if data[i] != 0xFF:
+            i += 1
+            continue
+        marker = data[i + 1]
+        if marker == 0xFF or marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            # Relleno y marcadores sin longitud
+            i += 1 if marker == 0xFF else 2
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            height, width = struct.unpack('>HH', data[i + 5:i + 9])
+            return width, height, data[i + 9]
+        i += 2 + struct.unpack('>H', data[i + 2:i + 4])[0]
+
+    return None
+
+
+def _jpeg_size(data: bytes) -> Optional[Tuple[int, int]]:
+    """Read (width, height) from the JPEG SOF marker without decoding"""
+    header = _jpeg_header(data)
+    return header[:2] if header else None
+
+
+def _is_publishable_jpeg(data: bytes, max_size: int) -> bool:
+    """
+    Check whether a JPEG can be stored as-is (no decode/re-encode)
+
+    True for 3-component (YCbCr) JPEGs within max_size whose size is reasonable
+    (under 8 bits per pixel; heavier files are re-encoded to save space)
+    """
+    header = _jpeg_header(data)
+    if not header:
+        return False
+
+    width, height, components = header
+    return (
+        components == 3
+        and 0 < width <= max_size
+        and 0 < height <= max_size
+        and len(data) <= width * height
+    )
+
+
+def _jpeg_scale_denominator(data: bytes, max_size: int) -> int:
+    """Largest DCT downscale (1/8, 1/4, 1/2) that still leaves the long side >= max_size"""
+    size = _jpeg_size(data)
+    if not size:
+        return 1
+
+    longest = max(size)
+    for denominator in _JPEG_SCALE_DENOMINATORS:
+        if -(-longest // denominator) >= max_size:
+            return denominator
+    return 1
+
+
+def _decode_image(data: bytes, max_size: int) -> Optional[np.ndarray]:
+    """
+    Decode image bytes to a BGR(A) array (libjpeg-turbo for JPEG when available)
+
+    Large JPEGs are decoded directly at a reduced scale; the final resize only refines it
+    """
+    denominator = _jpeg_scale_denominator(data, max_size) if data[:2] == JPEG_MAGIC else 1
+
+    if HAS_TURBOJPEG and data[:2] == JPEG_MAGIC:
+        try:
+            return _turbo_jpeg.decode(data, pixel_format=TJPF_BGR, scaling_factor=(1, denominator))
+        except Exception as e:
+            # CMYK y otras variantes poco comunes: OpenCV
+            logger.debug(f"TurboJPEG decode failed, using OpenCV: {e}")
+
+    buffer = np.frombuffer(data, np.uint8)
+    if denominator > 1:
+        return cv2.imdecode(buffer, _CV2_REDUCED_FLAGS[denominator] | cv2.IMREAD_IGNORE_ORIENTATION)
+
+    # IMREAD_UNCHANGED: conservar alfa y no aplicar orientación EXIF (igual que PIL)
+    return cv2.imdecode(buffer, cv2.IMREAD_UNCHANGED)
+
+
+def _encode_jpeg(img: np.ndarray, quality: int) -> Optional[bytes]:
+    """Encode a BGR array as a progressive 4:2:0 JPEG"""
+    if HAS_TURBOJPEG:
+        return _turbo_jpeg.encode(
+            img, quality=quality, pixel_format=TJPF_BGR, jpeg_subsample=TJSAMP_420, flags=TJFLAG_PROGRESSIVE
+        )
+
+    ok, encoded = cv2.imencode('.jpg', img, [cv2.IMWRITE_JPEG_QUALITY, quality, *_CV2_JPEG_PARAMS])
+    return encoded.tobytes() if ok else None
+
+
+def _flatten_alpha(pixels: np.ndarray) -> np.ndarray:
+    """
+    Composite a 4-channel uint8 array over a white background
+
+    Integer uint16 arithmetic in a single vectorized pass (no float temporaries)
+    """
+    color = pixels[:, :, :3].astype(np.uint16)
+    alpha = pixels[:, :, 3:4].astype(np.uint16)
+    return ((color * alpha + 255 * (255 - alpha)) // 255).astype(np.uint8)
+
+
+def _encode_image(data: bytes, max_size: int, quality: int) -> Optional[bytes]:
+    """
+    Decode, flatten, resize and re-encode an image with OpenCV/libjpeg-turbo (SIMD kernels)
+
+    Returns:
+        JPEG bytes, or None if the format cannot be decoded or encoded
+    """
+    img = _decode_image(data, max_size)
+    if img is None:
+        return None
+
+    if img.dtype != np.uint8:
+        img = cv2.convertScaleAbs(img, alpha=255.0 / np.iinfo(img.dtype).max)
+
+    # Normalizar a BGR; el alfa se compone sobre fondo blanco
+    if img.ndim == 2:
+        img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+    elif img.shape[2] == 4:
+        img = _flatten_alpha(img)
+
+    # Resize if too large (mantiene proporción, como Image.thumbnail)
+    height, width = img.shape[:2]
+    if width > max_size or height > max_size:
+        scale = max_size / max(width, height)
+        new_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        img = cv2.resize(img, new_size, interpolation=cv2.INTER_LANCZOS4)
+
+    # None si imencode falla: el llamador cae a PIL
+    return _encode_jpeg(img, quality)
+
+
+def _encode_image_pil(data: bytes, max_size: int, quality: int) -> bytes:
+    """Process image with PIL (formats OpenCV cannot decode)"""
+    with Image.open(io.BytesIO(data)) as img:
+        # Convert to RGB if necessary
+        if img.mode in ('RGBA', 'LA', 'P'):
+            img = Image.fromarray(_flatten_alpha(np.asarray(img.convert('RGBA'))), 'RGB')
+        elif img.mode != 'RGB':
+            img = img.convert('RGB')
+
+        # Resize if too large
+        if img.width > max_size or img.height > max_size:
+            img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+
+        # Save optimized
+        buffer = io.BytesIO()
+        img.save(
+            buffer,
+            format='JPEG',
+            quality=quality,
+            optimize=True,
+            progressive=True,
+            subsampling=2  # 4:2:0
+        )
+        return buffer.getvalue()
+
+
+def _encode_image_nvjpeg(data: bytes, max_size: int, quality: int) -> Optional[bytes]:
+    """
+    Decode, resize and re-encode a JPEG on the GPU (nvJPEG through torchvision)
+
+    Returns:
+        JPEG bytes, or None if the GPU path fails (caller falls back to the CPU pool)
+    """
+    torch, torch_functional, ImageReadMode, decode_jpeg, encode_jpeg = _nvjpeg_modules
+    try:
+        img = decode_jpeg(torch.frombuffer(data, dtype=torch.uint8), mode=ImageReadMode.RGB, device='cuda')
+
+        # Resize if too large (mantiene proporción)
+        height, width = img.shape[1:]
+        if width > max_size or height > max_size:
+            scale = max_size / max(width, height)
+            new_size = (max(1, round(height * scale)), max(1, round(width * scale)))
+            resized = torch_functional.interpolate(
+                img.unsqueeze(0).float(), size=new_size, mode='bicubic', antialias=True
+            )
+            img = resized.squeeze(0).clamp_(0, 255).round_().to(torch.uint8)
+
+        return encode_jpeg(img, quality=quality).cpu().numpy().tobytes()
+    except Exception as e:
+        logger.debug(f"nvJPEG processing failed, using CPU: {e}")
+        return None
+
+
+def _exceeds_pixel_limit(data: bytes) -> bool:
+    """
+    Header-only decompression bomb check, with PIL's limit (OpenCV accepts up to 2^30 pixels)
+
+    Same threshold at which Image.open raises DecompressionBombError (2x MAX_IMAGE_PIXELS)
+    """
+    if Image.MAX_IMAGE_PIXELS is None:
+        return False
+
+    header = _jpeg_header(data)
+    if header:
+        width, height, _ = header
+    else:
+        try:
+            with Image.open(io.BytesIO(data)) as img:
+                width, height = img.size
+        except Image.DecompressionBombError:
+            return True
+        except Exception:
+            return False  # Formato ilegible: lo resuelve el decode normal
+
+    return width * height > 2 * Image.MAX_IMAGE_PIXELS
+
+
+def _process_image_sync(data: bytes, output_path: str, max_size: int, quality: int) -> Optional[dict]:
+    """
+    Decode/resize/encode image bytes, write the JPEG to output_path and assess its quality
+
+    The assessment runs in the same worker on exactly what is written: re-encoded output is
+    decoded once from memory (a palette source would otherwise be scored on its palette),
+    and an already-sized JPEG passthrough reuses its own decode. The file is never re-read
+
+    Returns:
+        ImageQualityAssessor result, or None if the image could not be decoded/assessed here
+
+    Raises:
+        ValueError: If the image header exceeds the decompression bomb pixel limit
+    """
+    if _exceeds_pixel_limit(data):
+        # Ni decodificar ni copiar: el fallback evaluaría el archivo completo desde disco
+        raise ValueError(f"Image exceeds pixel limit (possible decompression bomb): {output_path}")
+
+    img = None
+    try:
+        if _is_publishable_jpeg(data, max_size):
+            # JPEG ya dimensionado (típico de CDNs): re-codificar solo perdería calidad
+            encoded = data
+            img = _decode_image(data, max_size)
+        else:
+            encoded = _encode_image(data, max_size, quality) or _encode_image_pil(data, max_size, quality)
+            img = cv2.imdecode(np.frombuffer(encoded, np.uint8), cv2.IMREAD_COLOR)
+    except Exception as e:
+        logger.error(f"Error processing image {output_path}: {e}")
+        # Copy original if processing fails
+        encoded = data
+
+    with open(output_path, 'wb') as f:
+        f.write(encoded)
+
+    if img is None:
+        return None
+    try:
+        # Clave por bytes descargados: la misma imagen en otra URL o re-descargada no se re-evalúa
+        cache_key = ImageQualityAssessor.bytes_cache_key(data, max_size, quality)
+        return ImageQualityAssessor.comprehensive_assessment_array(
+            img, name=os.path.basename(output_path), cache_key=cache_key
+        )
+    except Exception as e:
+        logger.error(f"Error during in-memory quality assessment {output_path}: {e}")
+        return None
+
+
+# BLAKE2b de 6 bytes (12 hex): stdlib, más rápido que MD5 y estable en cualquier entorno.
+# Copiar un estado ya inicializado evita re-parametrizar el hash en cada URL (~30% menos por URL)
+_URL_HASH_PROTOTYPE = hashlib.blake2b(digest_size=6)
+
+
+@lru_cache(maxsize=4096)
+def _image_filename(url: str, category: str) -> str:
+    """Filename for an image URL: category, URL hash and a whitelisted extension"""
+    url_hasher = _URL_HASH_PROTOTYPE.copy()
+    url_hasher.update(url.encode())
+    url_hash = url_hasher.hexdigest()
+    parsed = urlparse(url)
+    extension = Path(parsed.path).suffix or '.jpg'
+
+    if extension.lower() not in ['.jpg', '.jpeg', '.png', '.webp']:
+        extension = '.jpg'
+
+    return f"{category}_{url_hash}{extension}"
+
+
+def _walk_files(path):
+    """Recursively yield file DirEntry objects under path (os.scandir, no symlink following)"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+
+class ByteSemaphore:
+    """
+    Async semaphore over a byte budget instead of a request count
+
+    A single request larger than the whole budget is clamped to it, so it still runs (alone)
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._available = capacity
+        self._condition = asyncio.Condition()
+
+    async def acquire(self, size: int) -> int:
+        """Wait until size bytes are available; returns the amount actually reserved"""
+        size = min(max(size, 0), self.capacity)
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._available >= size)
+            self._available -= size
+        return size
+
+    async def release(self, size: int) -> None:
+        """Return size bytes to the budget and wake up waiters"""
+        async with self._condition:
+            self._available += size
+            self._condition.notify_all()
+
+    @asynccontextmanager
+    async def reserve(self, size: int):
+        """Hold size bytes of the budget for the duration of the block"""
+        reserved = await self.acquire(size)
+        try:
+            yield reserved
+        finally:
+            await self.release(reserved)
+
 
 class ImageHandler:
     """Handle image downloading and processing"""
@@ -25,7 +429,10 @@ class ImageHandler:
         timeout: int = 30,
         supabase_url: Optional[str] = None,
         supabase_key: Optional[str] = None,
-        storage_bucket: str = "noticias"
+        storage_bucket: str = "noticias",
+        process_workers: Optional[int] = None,
+        backend: Optional[str] = None,
+        max_inflight_bytes: int = 256 * 1024 * 1024
     ):
         self.output_dir = Path(output_dir)
         self.max_size = max_size
@@ -36,23 +443,86 @@ class ImageHandler:
         self.storage_bucket = storage_bucket
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def _generate_filename(self, url: str, category: str) -> str:
-        """Generate unique filename from URL"""
-        url_hash = hashlib.md5(url.encode()).hexdigest()[:12]
-        parsed = urlparse(url)
-        extension = Path(parsed.path).suffix or '.jpg'
+        # Cliente compartido: keep-alive (y multiplexado HTTP/2) entre descargas y uploads
+        self.client = httpx.AsyncClient(
+            timeout=self.timeout,
+            follow_redirects=True,
+            http2=HAS_HTTP2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
+
+        # Decode/resize/encode en paralelo real (fuera del GIL), un proceso por core por defecto
+        self._process_workers = process_workers or os.cpu_count()
+        self._pool = self._new_pool()
+        self._category_paths: dict[str, Path] = {}
+        # Descargas en curso por nombre de archivo -> resultado final (single-flight)
+        self._inflight: dict[str, asyncio.Future] = {}
+        # Tope de bytes en memoria (cuerpo + procesamiento) entre todas las descargas concurrentes
+        self._byte_budget = ByteSemaphore(max_inflight_bytes)
+
+        # Backend 'nvjpeg': JPEGs grandes se procesan en GPU desde un único hilo dedicado
+        # (CUDA no sobrevive al fork del pool de procesos); el resto sigue en CPU
+        self.backend = backend or os.getenv("IMAGE_BACKEND", "cpu")
+        self._gpu_executor = None
+        if self.backend == 'nvjpeg':
+            if _load_nvjpeg():
+                self._gpu_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nvjpeg")
+                logger.info("Image backend: nvJPEG (CUDA)")
+            else:
+                logger.warning("nvjpeg backend requested but torchvision/CUDA is unavailable; using CPU")
 
-        if extension.lower() not in ['.jpg', '.jpeg', '.png', '.webp']:
-            extension = '.jpg'
+        if not HAS_LIBJPEG_TURBO:
+            logger.warning("Pillow is not built with libjpeg-turbo; JPEG encode/decode will be slower")
 
-        return f"{category}_{url_hash}{extension}"
+    def _new_pool(self) -> ProcessPoolExecutor:
+        """
+        Worker pool for _process_image_sync
+
+        Workers start from a forkserver (spawn where unavailable), not a fork of this
+        process: forking a running event loop with live threads can inherit held locks
+        """
+        start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        return ProcessPoolExecutor(
+            max_workers=self._process_workers,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker
+        )
+
+    def _restart_pool(self, broken: ProcessPoolExecutor):
+        """Replace a broken worker pool (once, even if several callers notice it)"""
+        if self._pool is broken:
+            logger.warning("Image worker pool broken (a worker died); restarting it")
+            broken.shutdown(wait=False, cancel_futures=True)
+            self._pool = self._new_pool()
+
+    async def close(self):
+        """Cerrar el cliente HTTP compartido y el pool de procesos"""
+        await self.client.aclose()
+        self._pool.shutdown()
+        if self._gpu_executor:
+            self._gpu_executor.shutdown()
+
+    def _generate_filename(self, url: str, category: str) -> str:
+        """Generate unique filename from URL"""
+        return _image_filename(url, category)
 
     def _get_category_path(self, category: str) -> Path:
-        """Get or create category directory"""
-        category_path = self.output_dir / category.lower()
-        category_path.mkdir(parents=True, exist_ok=True)
+        """Get or create category directory (mkdir only the first time per category)"""
+        category_path = self._category_paths.get(category)
+        if category_path is None:
+            category_path = self.output_dir / category.lower()
+            category_path.mkdir(parents=True, exist_ok=True)
+            self._category_paths[category] = category_path
         return category_path
 
+    @staticmethod
+    async def _read_chunks(local_path: Path):
+        """Yield the file in UPLOAD_CHUNK_SIZE chunks (streamed upload body)"""
+        # Cada read() en un hilo: un page fault o un disco lento no frena el event loop
+        with open(local_path, 'rb') as f:
+            while chunk := await asyncio.to_thread(f.read, UPLOAD_CHUNK_SIZE):
+                yield chunk
+
     async def _upload_to_supabase(self, local_path: Path, remote_path: str) -> Optional[str]:
         """
         Upload image to Supabase Storage
@@ -69,33 +539,30 @@ class ImageHandler:
             return None
 
         try:
-            async with aiofiles.open(local_path, 'rb') as f:
-                image_data = await f.read()
-
             headers = {
                 "apikey": self.supabase_key,
                 "Authorization": f"Bearer {self.supabase_key}",
                 "Content-Type": "image/jpeg",
+                "Content-Length": str(local_path.stat().st_size),
                 "x-upsert": "true"  # Overwrite if exists
             }
 
             upload_url = f"{self.supabase_url}/storage/v1/object/{self.storage_bucket}/{remote_path}"
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    upload_url,
-                    headers=headers,
-                    content=image_data
-                )
-
-                if response.status_code in [200, 201]:
-                    # Return public URL
-                    public_url = f"{self.supabase_url}/storage/v1/object/public/{self.storage_bucket}/{remote_path}"
-                    logger.info(f"Uploaded image to Supabase: {remote_path}")
-                    return public_url
-                else:
-                    logger.error(f"Failed to upload image to Supabase: {response.status_code} - {response.text}")
-                    return None
+            response = await self.client.post(
+                upload_url,
+                headers=headers,
+                content=self._read_chunks(local_path)
+            )
+
+            if response.status_code in [200, 201]:
+                # Return public URL
+                public_url = f"{self.supabase_url}/storage/v1/object/public/{self.storage_bucket}/{remote_path}"
+                logger.info(f"Uploaded image to Supabase: {remote_path}")
+                return public_url
+            else:
+                logger.error(f"Failed to upload image to Supabase: {response.status_code} - {response.text}")
+                return None
 
         except Exception as e:
             logger.error(f"Error uploading image to Supabase: {e}")
@@ -118,6 +585,71 @@ class ImageHandler:
         Returns:
             Path to downloaded image or None if failed
         """
+        # Single-flight: llamadas concurrentes por la misma imagen comparten la descarga
+        # y reciben el mismo resultado final. force=True no se une: descarga de nuevo
+        key = self._generate_filename(url, category)
+        future, owner = self._claim(key, force)
+        if not owner:
+            logger.debug(f"Joining in-flight download: {url}")
+            return await asyncio.shield(future)
+
+        result = None
+        try:
+            result = await self._publish(await self._download_and_process(url, category, force))
+            return result
+        finally:
+            self._settle(key, future, result)
+
+    def _claim(self, key: str, force: bool = False) -> Tuple[asyncio.Future, bool]:
+        """
+        Join the in-flight download of an image, or register a new one
+
+        Returns:
+            (future with the final result, True if the caller owns the download and must settle it)
+        """
+        inflight = self._inflight.get(key)
+        if inflight is not None and not force:
+            return inflight, False
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        return future, True
+
+    def _settle(self, key: str, future: asyncio.Future, result: Optional[str]):
+        """Publish an owned download's final result to every caller that joined it"""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.done():
+            future.set_result(result)
+
+    async def _publish(self, fetched: Optional[Tuple[Path, bool]]) -> Optional[str]:
+        """Upload a newly downloaded image; return its public URL, or the local relative path"""
+        if fetched is None:
+            return None
+
+        output_path, is_new = fetched
+        relative_path = str(output_path.relative_to(self.output_dir))
+        if not is_new:
+            return relative_path
+
+        # Upload to Supabase Storage
+        supabase_url = await self._upload_to_supabase(output_path, relative_path)
+
+        # Return Supabase URL if uploaded, otherwise local path
+        return supabase_url or relative_path
+
+    async def _download_and_process(
+        self,
+        url: str,
+        category: str,
+        force: bool = False
+    ) -> Optional[Tuple[Path, bool]]:
+        """
+        Download, process and quality-check one image (no upload)
+
+        Returns:
+            (local path, True if newly downloaded) or None if failed/rejected
+        """
         try:
             # Generate paths
             filename = self._generate_filename(url, category)
@@ -127,7 +659,7 @@ class ImageHandler:
             # Check if already exists
             if output_path.exists() and not force:
                 logger.debug(f"Image already exists: {output_path}")
-                return str(output_path.relative_to(self.output_dir))
+                return output_path, False
 
             # Download image with proper headers to avoid 403 errors
             headers = {
@@ -136,60 +668,52 @@ class ImageHandler:
                 'Accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
                 'Accept-Language': 'es-AR,es;q=0.9,en;q=0.8',
             }
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                logger.debug(f"Downloading image: {url}")
-                response = await client.get(url, headers=headers, follow_redirects=True)
+            logger.debug(f"Downloading image: {url}")
+            async with self.client.stream('GET', url, headers=headers) as response:
                 response.raise_for_status()
 
-                # Save to temporary file
-                temp_path = output_path.with_suffix('.tmp')
-                async with aiofiles.open(temp_path, 'wb') as f:
-                    await f.write(response.content)
-
-                # Process image
-                await self._process_image(temp_path, output_path)
-
-                # Remove temp file
-                temp_path.unlink(missing_ok=True)
+                # Reservar el presupuesto según Content-Length antes de bufferear el cuerpo
+                content_length = response.headers.get('content-length')
+                size = int(content_length) if content_length and content_length.isdigit() else UNKNOWN_CONTENT_LENGTH
+                async with self._byte_budget.reserve(size):
+                    data = await response.aread()
 
-                logger.info(f"Image downloaded: {url} -> {output_path}")
+                    # Process image in memory (no temp file); the worker also assesses the decoded array
+                    quality_assessment = await self._process_image(data, output_path)
 
-                # ===== NEW: Computer Vision Quality Validation =====
-                # Validate image quality before uploading to Supabase
-                try:
-                    quality_assessment = ImageQualityAssessor.comprehensive_assessment(output_path)
+            logger.info(f"Image downloaded: {url} -> {output_path}")
 
-                    if not quality_assessment['is_acceptable']:
-                        logger.warning(
-                            f"Image REJECTED due to low quality: {url}\n"
-                            f"  Score: {quality_assessment['overall_score']}/100\n"
-                            f"  Tier: {quality_assessment['quality_tier']}\n"
-                            f"  Reasons: {', '.join(quality_assessment['rejection_reasons'])}"
-                        )
-
-                        # Delete low-quality image
-                        output_path.unlink(missing_ok=True)
-                        return None
+            # ===== NEW: Computer Vision Quality Validation =====
+            # Validate image quality before uploading to Supabase
+            try:
+                if quality_assessment is None:
+                    quality_assessment = await asyncio.to_thread(
+                        ImageQualityAssessor.comprehensive_assessment, output_path
+                    )
 
-                    logger.info(
-                        f"Image ACCEPTED - Quality score: {quality_assessment['overall_score']}/100 "
-                        f"({quality_assessment['quality_tier']}) - {url}"
+                if not quality_assessment['is_acceptable']:
+                    logger.warning(
+                        f"Image REJECTED due to low quality: {url}\n"
+                        f"  Score: {quality_assessment['overall_score']}/100\n"
+                        f"  Tier: {quality_assessment['quality_tier']}\n"
+                        f"  Reasons: {', '.join(quality_assessment['rejection_reasons'])}"
                     )
 
-                except Exception as e:
-                    logger.error(f"Error during quality assessment, accepting image anyway: {e}")
-                    # Continue with upload if validation fails (fail-safe)
-                # ===== END Quality Validation =====
+                    # Delete low-quality image
+                    output_path.unlink(missing_ok=True)
+                    return None
+
+                logger.info(
+                    f"Image ACCEPTED - Quality score: {quality_assessment['overall_score']}/100 "
+                    f"({quality_assessment['quality_tier']}) - {url}"
+                )
 
-                # Upload to Supabase Storage
-                relative_path = str(output_path.relative_to(self.output_dir))
-                supabase_url = await self._upload_to_supabase(output_path, relative_path)
+            except Exception as e:
+                logger.error(f"Error during quality assessment, accepting image anyway: {e}")
+                # Continue with upload if validation fails (fail-safe)
+            # ===== END Quality Validation =====
 
-                # Return Supabase URL if uploaded, otherwise local path
-                if supabase_url:
-                    return supabase_url
-                else:
-                    return relative_path
+            return output_path, True
 
         except httpx.HTTPError as e:
             logger.error(f"HTTP error downloading image {url}: {e}")
@@ -198,39 +722,40 @@ class ImageHandler:
             logger.error(f"Error downloading image {url}: {e}")
             return None
 
-    async def _process_image(self, input_path: Path, output_path: Path) -> None:
-        """Process and optimize image"""
-        try:
-            # Open image
-            with Image.open(input_path) as img:
-                # Convert to RGB if necessary
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                    img = background
-                elif img.mode != 'RGB':
-                    img = img.convert('RGB')
-
-                # Resize if too large
-                if img.width > self.max_size or img.height > self.max_size:
-                    img.thumbnail((self.max_size, self.max_size), Image.Resampling.LANCZOS)
-
-                # Save optimized
-                img.save(
-                    output_path,
-                    format='JPEG',
-                    quality=self.quality,
-                    optimize=True
-                )
+    async def _process_image(self, data: bytes, output_path: Path) -> Optional[dict]:
+        """
+        Process and optimize downloaded image bytes into output_path (in a worker process)
 
-                logger.debug(f"Image processed: {output_path}")
+        Returns:
+            Quality assessment of the in-memory image, or None if it must be assessed from disk
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._gpu_executor and data[:2] == JPEG_MAGIC and not _is_publishable_jpeg(data, self.max_size):
+            encoded = await loop.run_in_executor(
+                self._gpu_executor, _encode_image_nvjpeg, data, self.max_size, self.quality
+            )
+            if encoded is not None:
+                await asyncio.to_thread(output_path.write_bytes, encoded)
+                logger.debug(f"Image processed on GPU: {output_path}")
+                return None
 
-        except Exception as e:
-            logger.error(f"Error processing image {input_path}: {e}")
-            # Copy original if processing fails
-            output_path.write_bytes(input_path.read_bytes())
+        # Un worker muerto (OOM, segfault en un decoder) rompe todo el pool: se reemplaza y
+        # se reintenta una vez, ya que la imagen en curso puede no ser la culpable
+        for attempt in range(2):
+            pool = self._pool
+            try:
+                quality_assessment = await loop.run_in_executor(
+                    pool, _process_image_sync, data, str(output_path), self.max_size, self.quality
+                )
+                break
+            except BrokenProcessPool:
+                self._restart_pool(pool)
+                if attempt:
+                    raise
+
+        logger.debug(f"Image processed: {output_path}")
+        return quality_assessment
 
     async def download_multiple(
         self,
@@ -241,6 +766,9 @@ class ImageHandler:
         """
         Download multiple images concurrently
 
+        Downloads are processed first and the new images are then uploaded together,
+        so the uploads share (and multiplex over) the pooled connection
+
         Args:
             urls: List of image URLs
             category: Category for organization
@@ -251,23 +779,74 @@ class ImageHandler:
         """
         semaphore = asyncio.Semaphore(max_concurrent)
 
-        async def download_with_semaphore(url: str) -> Optional[str]:
+        # Una descarga por imagen: los duplicados del lote comparten la entrada, y las
+        # descargas en curso de otros llamadores se esperan al final (single-flight)
+        keys = [self._generate_filename(url, category) for url in urls]
+        owned: dict[str, Tuple[str, asyncio.Future]] = {}
+        joined: dict[str, asyncio.Future] = {}
+        for url, key in zip(urls, keys):
+            if key in owned or key in joined:
+                continue
+            future, owner = self._claim(key)
+            if owner:
+                owned[key] = (url, future)
+            else:
+                joined[key] = future
+
+        async def fetch_with_semaphore(url: str) -> Optional[Tuple[Path, bool]]:
             async with semaphore:
-                return await self.download_image(url, category)
+                return await self._download_and_process(url, category)
 
-        tasks = [download_with_semaphore(url) for url in urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        final: dict[str, Optional[str]] = {}
+        try:
+            results = await asyncio.gather(
+                *(fetch_with_semaphore(url) for url, _ in owned.values()),
+                return_exceptions=True
+            )
+
+            fetched = {}
+            for key, result in zip(owned, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error in concurrent download: {result}")
+                    result = None
+                fetched[key] = result
+                if result is not None:
+                    final[key] = str(result[0].relative_to(self.output_dir))
+
+            # Phase 2: upload new images in one batch
+            new_images = [(key, result[0]) for key, result in fetched.items() if result and result[1]]
+            uploaded = await self.upload_batch([path for _, path in new_images])
+            for (key, _), public_url in zip(new_images, uploaded):
+                if public_url:
+                    final[key] = public_url
+
+        finally:
+            # Resolver las propias antes de esperar ajenas: dos lotes que se esperan
+            # mutuamente no pueden bloquearse
+            for key, (_, future) in owned.items():
+                self._settle(key, future, final.get(key))
+
+        for key, future in joined.items():
+            final[key] = await asyncio.shield(future)
+
+        return [final.get(key) for key in keys]
+
+    async def upload_batch(self, paths: list[Path]) -> list[Optional[str]]:
+        """
+        Upload several local images to Supabase Storage concurrently
 
-        # Filter out exceptions
-        paths = []
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Error in concurrent download: {result}")
-                paths.append(None)
-            else:
-                paths.append(result)
+        Args:
+            paths: Local image paths inside output_dir
 
-        return paths
+        Returns:
+            Public URL for each path, or None where the upload failed/was skipped
+        """
+        tasks = [
+            self._upload_to_supabase(path, str(path.relative_to(self.output_dir)))
+            for path in paths
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return [None if isinstance(result, Exception) else result for result in results]
 
     def get_image_info(self, path: str) -> Optional[dict]:
         """Get image information"""
@@ -295,13 +874,13 @@ class ImageHandler:
         current_time = time.time()
         max_age = days * 24 * 60 * 60
 
-        for image_path in self.output_dir.rglob('*'):
-            if image_path.is_file():
-                age = current_time - image_path.stat().st_mtime
-                if age > max_age:
-                    image_path.unlink()
-                    count += 1
-                    logger.debug(f"Deleted old image: {image_path}")
+        for entry in _walk_files(self.output_dir):
+            # DirEntry.stat() reusa los datos del readdir cuando el SO los provee
+            age = current_time - entry.stat(follow_symlinks=False).st_mtime
+            if age > max_age:
+                os.unlink(entry.path)
+                count += 1
+                logger.debug(f"Deleted old image: {entry.path}")
 
         logger.info(f"Cleaned up {count} old images")
         return count
@@ -0,0 +1,51 @@
+-- ============================================================
+-- UNIQUE SOURCE_URL ON NOTICIAS
+-- Purpose: Let the scraper upsert with on_conflict=source_url
+-- (PostgREST needs a non-partial unique index on the conflict column)
+-- ============================================================
+
+-- Empty strings would all collide under a unique index
+UPDATE noticias SET source_url = NULL WHERE source_url = '';
+
+-- Duplicated source_urls block the unique index. Only the most recent row of each
+-- source_url is kept; the older ones (and their tags, removed by ON DELETE CASCADE)
+-- are moved to archive tables instead of being lost. Review them after migrating and
+-- drop the archive tables once nothing needs to be restored.
+CREATE TABLE IF NOT EXISTS noticias_source_url_duplicates (
+  LIKE noticias INCLUDING DEFAULTS,
+  archived_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS noticias_tags_source_url_duplicates (
+  LIKE noticias_tags,
+  archived_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TEMP TABLE noticias_stale_duplicates AS
+SELECT a.id
+FROM noticias a
+JOIN noticias b
+  ON a.source_url = b.source_url
+ AND (a.created_at, a.id) < (b.created_at, b.id)
+GROUP BY a.id;
+
+INSERT INTO noticias_source_url_duplicates
+SELECT n.*
+FROM noticias n
+JOIN noticias_stale_duplicates d ON d.id = n.id;
+
+INSERT INTO noticias_tags_source_url_duplicates
+SELECT t.*
+FROM noticias_tags t
+JOIN noticias_stale_duplicates d ON d.id = t.noticia_id;
+
+DELETE FROM noticias n
+USING noticias_stale_duplicates d
+WHERE n.id = d.id;
+
+DROP TABLE noticias_stale_duplicates;
+
+-- The unique index replaces both plain source_url indexes
+DROP INDEX IF EXISTS noticias_source_url_idx;
+DROP INDEX IF EXISTS idx_noticias_source_url;
+CREATE UNIQUE INDEX IF NOT EXISTS noticias_source_url_key ON noticias(source_url);
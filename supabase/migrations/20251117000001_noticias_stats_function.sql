@@ -0,0 +1,14 @@
+-- ============================================================
+-- NOTICIAS STATS RPC
+-- Purpose: Article counts per category in one grouped query,
+-- called by the scraper as POST /rest/v1/rpc/noticias_stats
+-- ============================================================
+
+CREATE OR REPLACE FUNCTION noticias_stats()
+RETURNS TABLE(slug TEXT, count BIGINT)
+LANGUAGE sql STABLE AS $$
+  SELECT c.slug::TEXT, COUNT(n.id)
+  FROM categorias c
+  LEFT JOIN noticias n ON n.category_id = c.id
+  GROUP BY c.slug;
+$$;